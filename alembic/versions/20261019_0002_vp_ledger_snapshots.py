@@ -0,0 +1,56 @@
+"""VP ledger seq, rollup snapshots and job checkpoints
+
+Revision ID: 20261019_0002
+Revises: 20241008_0001
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0002"
+down_revision = "20241008_0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Existing rows are numbered by the identity sequence when the column is added.
+    op.add_column(
+        "verification_points",
+        sa.Column("seq", sa.BigInteger(), sa.Identity(), nullable=False),
+    )
+    op.create_unique_constraint("uq_verification_points_seq", "verification_points", ["seq"])
+    op.create_index("ix_verification_points_user_id_seq", "verification_points", ["user_id", "seq"])
+
+    op.create_table(
+        "vp_ledger_snapshots",
+        sa.Column(
+            "user_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            primary_key=True,
+            nullable=False,
+        ),
+        sa.Column("delta_total", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("entry_count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("last_seq", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+
+    op.create_table(
+        "job_checkpoints",
+        sa.Column("name", sa.String(length=64), primary_key=True, nullable=False),
+        sa.Column("position", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("job_checkpoints")
+    op.drop_table("vp_ledger_snapshots")
+    op.drop_index("ix_verification_points_user_id_seq", table_name="verification_points")
+    op.drop_constraint("uq_verification_points_seq", "verification_points", type_="unique")
+    op.drop_column("verification_points", "seq")
@@ -0,0 +1,24 @@
+"""keyset pagination indexes on records
+
+Revision ID: 20261019_0003
+Revises: 20261019_0002
+Create Date: 2026-10-19
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0003"
+down_revision = "20261019_0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_records_created_at_id", "records", ["created_at", "id"])
+    op.create_index("ix_records_status_created_at_id", "records", ["status", "created_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_records_status_created_at_id", table_name="records")
+    op.drop_index("ix_records_created_at_id", table_name="records")
@@ -0,0 +1,34 @@
+"""evidence link check cache
+
+Revision ID: 20261019_0004
+Revises: 20261019_0003
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0004"
+down_revision = "20261019_0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "evidence_link_checks",
+        sa.Column("url", sa.String(length=500), primary_key=True, nullable=False),
+        sa.Column("status_code", sa.Integer(), nullable=True),
+        sa.Column("final_url", sa.String(length=2000), nullable=True),
+        sa.Column("error", sa.String(length=200), nullable=True),
+        sa.Column("failure_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("checked_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("next_check_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index("ix_evidence_link_checks_next_check_at", "evidence_link_checks", ["next_check_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_evidence_link_checks_next_check_at", table_name="evidence_link_checks")
+    op.drop_table("evidence_link_checks")
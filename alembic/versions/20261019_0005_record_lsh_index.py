@@ -0,0 +1,49 @@
+"""MinHash fingerprints and LSH buckets for near-duplicate detection
+
+Revision ID: 20261019_0005
+Revises: 20261019_0004
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0005"
+down_revision = "20261019_0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "record_fingerprints",
+        sa.Column(
+            "record_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("records.id", ondelete="CASCADE"),
+            primary_key=True,
+            nullable=False,
+        ),
+        sa.Column("minhash", postgresql.ARRAY(sa.BigInteger()), nullable=False),
+    )
+    op.create_table(
+        "record_lsh_buckets",
+        sa.Column("band", sa.SmallInteger(), primary_key=True, nullable=False),
+        sa.Column("bucket", sa.BigInteger(), primary_key=True, nullable=False),
+        sa.Column(
+            "record_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("records.id", ondelete="CASCADE"),
+            primary_key=True,
+            nullable=False,
+        ),
+    )
+    op.create_index("ix_record_lsh_buckets_record_id", "record_lsh_buckets", ["record_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_record_lsh_buckets_record_id", table_name="record_lsh_buckets")
+    op.drop_table("record_lsh_buckets")
+    op.drop_table("record_fingerprints")
@@ -0,0 +1,41 @@
+"""feed bucket counters
+
+Revision ID: 20261019_0006
+Revises: 20261019_0005
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0006"
+down_revision = "20261019_0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "feed_bucket_counters",
+        sa.Column("bucket", sa.String(length=32), primary_key=True, nullable=False),
+        sa.Column("record_count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.execute(
+        """
+        INSERT INTO feed_bucket_counters (bucket, record_count)
+        SELECT b.bucket, COUNT(r.id)
+        FROM (VALUES ('live'), ('investigating'), ('archive')) AS b(bucket)
+        LEFT JOIN records r ON CASE r.status
+            WHEN 'live' THEN 'live'
+            WHEN 'under_review' THEN 'investigating'
+            ELSE 'archive'
+        END = b.bucket
+        GROUP BY b.bucket
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("feed_bucket_counters")
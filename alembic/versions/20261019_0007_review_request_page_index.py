@@ -0,0 +1,26 @@
+"""index for paging review requests per record
+
+Revision ID: 20261019_0007
+Revises: 20261019_0006
+Create Date: 2026-10-19
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0007"
+down_revision = "20261019_0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_review_requests_record_id_created_at_id",
+        "review_requests",
+        ["record_id", "created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_review_requests_record_id_created_at_id", table_name="review_requests")
@@ -0,0 +1,41 @@
+"""verified record count per user and leaderboard indexes
+
+Revision ID: 20261019_0008
+Revises: 20261019_0007
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0008"
+down_revision = "20261019_0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "users",
+        sa.Column("verified_record_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.execute(
+        """
+        UPDATE users SET verified_record_count = v.n
+        FROM (
+            SELECT created_by, COUNT(*) AS n FROM records
+            WHERE status = 'verified' AND created_by IS NOT NULL
+            GROUP BY created_by
+        ) AS v
+        WHERE users.id = v.created_by
+        """
+    )
+    op.create_index("ix_users_vp_balance_id", "users", ["vp_balance", "id"])
+    op.create_index("ix_users_verified_record_count_id", "users", ["verified_record_count", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_verified_record_count_id", table_name="users")
+    op.drop_index("ix_users_vp_balance_id", table_name="users")
+    op.drop_column("users", "verified_record_count")
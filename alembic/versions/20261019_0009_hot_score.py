@@ -0,0 +1,38 @@
+"""precomputed hot score on records
+
+Revision ID: 20261019_0009
+Revises: 20261019_0008
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261019_0009"
+down_revision = "20261019_0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("records", sa.Column("hot_score", sa.Float(), nullable=True))
+    # Every existing row starts stale; python -m app.jobs.refresh_hot_scores fills them in.
+    op.add_column(
+        "records",
+        sa.Column("hot_score_stale", sa.Boolean(), nullable=False, server_default=sa.text("true")),
+    )
+    op.create_index("ix_records_status_hot_score_id", "records", ["status", "hot_score", "id"])
+    op.create_index(
+        "ix_records_hot_score_stale",
+        "records",
+        ["id"],
+        postgresql_where=sa.text("hot_score_stale"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_records_hot_score_stale", table_name="records")
+    op.drop_index("ix_records_status_hot_score_id", table_name="records")
+    op.drop_column("records", "hot_score_stale")
+    op.drop_column("records", "hot_score")
@@ -10,6 +10,23 @@ class Settings(BaseSettings):
     review_request_duration_hours: int = Field(72, env="REVIEW_REQUEST_DURATION_HOURS")
     session_secret: str = Field("change-me-session-secret", env="SESSION_SECRET")
     initial_vp: int = Field(10, env="INITIAL_VP")
+    vp_rollup_batch_size: int = Field(50000, env="VP_ROLLUP_BATCH_SIZE")
+    vp_rollup_settle_seconds: int = Field(300, env="VP_ROLLUP_SETTLE_SECONDS")
+    vp_reconcile_batch_size: int = Field(10000, env="VP_RECONCILE_BATCH_SIZE")
+    evidence_check_batch_size: int = Field(500, env="EVIDENCE_CHECK_BATCH_SIZE")
+    evidence_check_concurrency: int = Field(20, env="EVIDENCE_CHECK_CONCURRENCY")
+    evidence_check_per_host: int = Field(2, env="EVIDENCE_CHECK_PER_HOST")
+    evidence_check_timeout_seconds: float = Field(10.0, env="EVIDENCE_CHECK_TIMEOUT_SECONDS")
+    evidence_check_allow_private: bool = Field(False, env="EVIDENCE_CHECK_ALLOW_PRIVATE")
+    snapshot_dir: str = Field("var/snapshots", env="SNAPSHOT_DIR")
+    hot_refresh_batch_size: int = Field(1000, env="HOT_REFRESH_BATCH_SIZE")
+    leaderboard_refresh_seconds: int = Field(60, env="LEADERBOARD_REFRESH_SECONDS")
+    query_budget_mode: str = Field("warn", env="QUERY_BUDGET_MODE")  # off | warn | raise
+    server_timing_enabled: bool = Field(False, env="SERVER_TIMING_ENABLED")
+    slow_request_ms: int = Field(1000, env="SLOW_REQUEST_MS")  # 0 disables the slow log
+    slow_request_sample_rate: float = Field(1.0, env="SLOW_REQUEST_SAMPLE_RATE")
+    export_api_tokens: str = Field("", env="EXPORT_API_TOKENS")  # comma-separated Bearer tokens
+    export_rate_limit: int = Field(10, env="EXPORT_RATE_LIMIT")  # exports per client per hour
     base_url: AnyHttpUrl | None = None
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -1,7 +1,9 @@
+import secrets
 import uuid
 from fastapi import Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from .config import get_settings
 from .database import get_session
 from .models import User
 
@@ -29,3 +31,19 @@ async def get_optional_user(
     if not user_id:
         return None
     return await session.get(User, uuid.UUID(user_id))
+
+
+async def get_export_client(request: Request, session: AsyncSession = Depends(get_session)) -> str:
+    """
+    Identify who may run an archive export: a Bearer token from EXPORT_API_TOKENS, or a
+    logged-in user. Returns a stable key for rate limiting.
+    """
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and token:
+        configured = [t.strip() for t in get_settings().export_api_tokens.split(",") if t.strip()]
+        for index, candidate in enumerate(configured):
+            if secrets.compare_digest(token.encode(), candidate.encode()):
+                return f"token:{index}"
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid API token")
+    user = await get_current_user(request, session)
+    return f"user:{user.id}"
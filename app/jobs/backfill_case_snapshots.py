@@ -0,0 +1,39 @@
+import argparse
+import asyncio
+
+from sqlalchemy import select
+
+from ..database import AsyncSessionLocal
+from ..models import Record
+from ..services.snapshots import FINAL_STATUSES, write_case_snapshots
+
+BATCH_SIZE = 500
+
+
+async def run(force: bool = False):
+    written = 0
+    after = None
+    async with AsyncSessionLocal() as session:
+        while True:
+            stmt = (
+                select(Record.id)
+                .where(Record.status.in_(FINAL_STATUSES))
+                .order_by(Record.id)
+                .limit(BATCH_SIZE)
+            )
+            if after is not None:
+                stmt = stmt.where(Record.id > after)
+            record_ids = (await session.execute(stmt)).scalars().all()
+            if not record_ids:
+                break
+            written += await write_case_snapshots(session, record_ids, overwrite=force)
+            session.expunge_all()
+            after = record_ids[-1]
+    print(f"Wrote {written} case snapshots.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render static snapshots for finalized cases.")
+    parser.add_argument("--force", action="store_true", help="re-render snapshots that already exist")
+    args = parser.parse_args()
+    asyncio.run(run(force=args.force))
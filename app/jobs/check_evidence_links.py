@@ -0,0 +1,24 @@
+import argparse
+import asyncio
+from datetime import datetime, timezone
+
+from ..database import AsyncSessionLocal
+from ..services.evidence import check_due_links, discover_evidence_urls, make_client
+
+
+async def run(discover: bool = False):
+    async with AsyncSessionLocal() as session:
+        if discover:
+            await discover_evidence_urls(session)
+        async with make_client() as client:
+            count = await check_due_links(session, client, now=datetime.now(timezone.utc))
+        print(f"Checked {count} evidence URLs.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check due evidence URLs.")
+    parser.add_argument(
+        "--discover", action="store_true", help="queue URLs from existing records/review requests first"
+    )
+    args = parser.parse_args()
+    asyncio.run(run(discover=args.discover))
@@ -0,0 +1,39 @@
+import argparse
+import asyncio
+import sys
+from datetime import datetime
+
+from ..database import AsyncSessionLocal
+from ..pagination import decode_cursor
+from ..services.export import EXPORT_FORMATS, ExportFilter, export_archive
+
+
+async def run(args: argparse.Namespace):
+    filters = ExportFilter(
+        created_from=args.created_from,
+        created_to=args.created_to,
+        occurred_from=args.occurred_from,
+        occurred_to=args.occurred_to,
+        after=decode_cursor(args.cursor) if args.cursor else None,
+    )
+    out = open(args.out, "ab" if args.cursor else "wb") if args.out != "-" else sys.stdout.buffer
+    try:
+        async with AsyncSessionLocal() as session:
+            async for chunk in export_archive(session, filters, fmt=args.format, gzip=args.gzip):
+                out.write(chunk)
+    finally:
+        if out is not sys.stdout.buffer:
+            out.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stream verified/falsified records with their review requests.")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="ndjson")
+    parser.add_argument("--gzip", action="store_true")
+    parser.add_argument("--out", default="-", help="output file (default: stdout); appended to when resuming")
+    parser.add_argument("--created-from", type=datetime.fromisoformat)
+    parser.add_argument("--created-to", type=datetime.fromisoformat)
+    parser.add_argument("--occurred-from", type=datetime.fromisoformat)
+    parser.add_argument("--occurred-to", type=datetime.fromisoformat)
+    parser.add_argument("--cursor", help="resume after this cursor (last exported line's cursor)")
+    asyncio.run(run(parser.parse_args()))
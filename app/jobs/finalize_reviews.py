@@ -3,12 +3,14 @@ from datetime import datetime, timezone
 
 from ..database import AsyncSessionLocal
 from ..services.review import finalize_expired_reviews
+from ..services.snapshots import wait_for_pending_snapshots
 
 
 async def run():
     async with AsyncSessionLocal() as session:
         count = await finalize_expired_reviews(session, now=datetime.now(timezone.utc))
         print(f"Finalized {count} review requests.")
+    await wait_for_pending_snapshots()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,36 @@
+import asyncio
+
+from sqlalchemy import select
+
+from ..database import AsyncSessionLocal
+from ..models import Record, RecordFingerprint
+from ..services.duplicates import index_records
+
+BATCH_SIZE = 1000
+
+
+async def run():
+    """
+    Backfill the near-duplicate index for records that have no fingerprint yet.
+    """
+    indexed = 0
+    async with AsyncSessionLocal() as session:
+        while True:
+            result = await session.execute(
+                select(Record)
+                .outerjoin(RecordFingerprint, RecordFingerprint.record_id == Record.id)
+                .where(RecordFingerprint.record_id.is_(None))
+                .limit(BATCH_SIZE)
+            )
+            records = result.scalars().all()
+            if not records:
+                break
+            await index_records(session, records)
+            await session.commit()
+            session.expunge_all()
+            indexed += len(records)
+    print(f"Indexed {indexed} records.")
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
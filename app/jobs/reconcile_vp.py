@@ -0,0 +1,35 @@
+import argparse
+import asyncio
+import sys
+
+from ..database import AsyncSessionLocal
+from ..services.ledger import reconcile_vp_balances, repair_vp_snapshots
+
+
+async def run(repair: bool = False) -> int:
+    checked = 0
+    mismatched = 0
+    async with AsyncSessionLocal() as session:
+        if repair:
+            async for _, mismatches in reconcile_vp_balances(session):
+                repaired = await repair_vp_snapshots(session, [m.user_id for m in mismatches])
+                if repaired:
+                    print(f"Repaired {repaired} ledger snapshots.")
+        async for batch_count, mismatches in reconcile_vp_balances(session):
+            checked += batch_count
+            mismatched += len(mismatches)
+            for m in mismatches:
+                print(f"MISMATCH user={m.user_id} vp_balance={m.vp_balance} ledger={m.expected}")
+    print(f"Checked {checked} users, {mismatched} mismatched.")
+    return 1 if mismatched else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare users.vp_balance with the VP ledger.")
+    parser.add_argument(
+        "--repair",
+        action="store_true",
+        help="first recompute snapshots of mismatched users (folds in late-committed ledger rows)",
+    )
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(repair=args.repair)))
@@ -0,0 +1,15 @@
+import asyncio
+
+from ..config import get_settings
+from ..database import AsyncSessionLocal
+from ..services.hot import refresh_stale_hot_scores
+
+
+async def run():
+    async with AsyncSessionLocal() as session:
+        refreshed = await refresh_stale_hot_scores(session, get_settings().hot_refresh_batch_size)
+        print(f"Refreshed hot scores for {refreshed} records.")
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
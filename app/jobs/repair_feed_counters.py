@@ -0,0 +1,17 @@
+import asyncio
+
+from ..database import AsyncSessionLocal
+from ..services.feed_counters import repair_bucket_counters
+
+
+async def run():
+    async with AsyncSessionLocal() as session:
+        drift = await repair_bucket_counters(session)
+        if drift:
+            print("Corrected feed counters: " + ", ".join(f"{b} {d:+d}" for b, d in sorted(drift.items())))
+        else:
+            print("Feed counters are consistent.")
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
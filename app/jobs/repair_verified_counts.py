@@ -0,0 +1,17 @@
+import asyncio
+
+from ..database import AsyncSessionLocal
+from ..services.leaderboard import repair_verified_counts
+
+
+async def run():
+    async with AsyncSessionLocal() as session:
+        drift = await repair_verified_counts(session)
+        if drift:
+            print(f"Corrected verified_record_count for {len(drift)} users.")
+        else:
+            print("Verified record counts are consistent.")
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
@@ -0,0 +1,15 @@
+import asyncio
+from datetime import datetime, timezone
+
+from ..database import AsyncSessionLocal
+from ..services.ledger import rollup_vp_ledger
+
+
+async def run():
+    async with AsyncSessionLocal() as session:
+        count = await rollup_vp_ledger(session, now=datetime.now(timezone.utc))
+        print(f"Rolled up {count} VP ledger entries.")
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
@@ -6,7 +6,9 @@ from fastapi.templating import Jinja2Templates
 from starlette.middleware.sessions import SessionMiddleware
 
 from .config import get_settings
-from .routes import auth, pages, records
+from .database import engine
+from .profiling import ProfilingMiddleware, install_query_capture
+from .routes import api, auth, pages, records
 
 
 settings = get_settings()
@@ -18,6 +20,8 @@ app.add_middleware(
     max_age=60 * 60 * 24 * 30,  # 30 days
     same_site="lax",
 )
+app.add_middleware(ProfilingMiddleware)
+install_query_capture(engine)
 
 app.mount("/static", StaticFiles(directory="app/static"), name="static")
 templates = Jinja2Templates(directory="app/templates")
@@ -31,3 +35,4 @@ async def root() -> RedirectResponse:
 app.include_router(auth.router)
 app.include_router(pages.router)
 app.include_router(records.router)
+app.include_router(api.router)
@@ -4,8 +4,23 @@ import uuid
 from datetime import datetime, timezone
 from enum import StrEnum
 
-from sqlalchemy import DateTime, Enum, Float, ForeignKey, Integer, String, Text, func
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    Enum,
+    Float,
+    ForeignKey,
+    Identity,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+    Text,
+    UniqueConstraint,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -32,11 +47,16 @@ class ReviewVerdict(StrEnum):
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        Index("ix_users_vp_balance_id", "vp_balance", "id"),
+        Index("ix_users_verified_record_count_id", "verified_record_count", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     display_name: Mapped[str] = mapped_column(String(120), nullable=False)
     wallet_address: Mapped[str] = mapped_column(String(120), unique=True, nullable=False)
     vp_balance: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    verified_record_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -51,6 +71,12 @@ class User(Base):
 
 class Record(Base):
     __tablename__ = "records"
+    __table_args__ = (
+        Index("ix_records_created_at_id", "created_at", "id"),
+        Index("ix_records_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_records_status_hot_score_id", "status", "hot_score", "id"),
+        Index("ix_records_hot_score_stale", "id", postgresql_where=text("hot_score_stale")),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title: Mapped[str] = mapped_column(String(200), nullable=False)
@@ -60,6 +86,9 @@ class Record(Base):
     time_occurred_end: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     resolution_level: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
     resolution_multiplier: Mapped[float] = mapped_column(Float, nullable=False, default=1.0)
+    # Precomputed by services/hot.py; NULL until first scored.
+    hot_score: Mapped[float | None] = mapped_column(Float, nullable=True)
+    hot_score_stale: Mapped[bool] = mapped_column(default=True, nullable=False)
     status: Mapped[RecordStatus] = mapped_column(
         Enum(RecordStatus, native_enum=False, name="recordstatus"),
         nullable=False,
@@ -83,6 +112,9 @@ class Record(Base):
 
 class ReviewRequest(Base):
     __tablename__ = "review_requests"
+    __table_args__ = (
+        Index("ix_review_requests_record_id_created_at_id", "record_id", "created_at", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     record_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("records.id", ondelete="CASCADE"))
@@ -118,7 +150,14 @@ class VerificationPoint(Base):
 
     __tablename__ = "verification_points"
 
+    __table_args__ = (
+        UniqueConstraint("seq", name="uq_verification_points_seq"),
+        Index("ix_verification_points_user_id_seq", "user_id", "seq"),
+    )
+
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # Monotonic insert order; the ledger rollup uses it as its high-water mark.
+    seq: Mapped[int] = mapped_column(BigInteger, Identity(), nullable=False)
     user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
     record_id: Mapped[uuid.UUID | None] = mapped_column(ForeignKey("records.id", ondelete="SET NULL"))
     delta: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -129,3 +168,99 @@ class VerificationPoint(Base):
 
     user: Mapped["User"] = relationship(back_populates="vp_transactions")
     record: Mapped[Record | None] = relationship()
+
+
+class VerificationPointSnapshot(Base):
+    """
+    Per-user running total of VerificationPoint deltas up to last_seq.
+    Written incrementally by the ledger rollup job.
+    """
+
+    __tablename__ = "vp_ledger_snapshots"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    delta_total: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    entry_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    last_seq: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+
+class JobCheckpoint(Base):
+    """
+    High-water mark for incremental batch jobs, keyed by job name.
+    """
+
+    __tablename__ = "job_checkpoints"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    position: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+
+class EvidenceLinkCheck(Base):
+    """
+    Cached reachability of an evidence URL, refreshed by the evidence link checker job.
+    """
+
+    __tablename__ = "evidence_link_checks"
+
+    url: Mapped[str] = mapped_column(String(500), primary_key=True)
+    status_code: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    final_url: Mapped[str | None] = mapped_column(String(2000), nullable=True)
+    error: Mapped[str | None] = mapped_column(String(200), nullable=True)
+    failure_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    checked_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    next_check_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False, index=True
+    )
+
+    @property
+    def is_ok(self) -> bool:
+        return self.status_code is not None and self.status_code < 400
+
+
+class RecordFingerprint(Base):
+    """
+    MinHash signature of a record's title + body, used to score near-duplicate candidates.
+    """
+
+    __tablename__ = "record_fingerprints"
+
+    record_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("records.id", ondelete="CASCADE"), primary_key=True
+    )
+    minhash: Mapped[list[int]] = mapped_column(ARRAY(BigInteger), nullable=False)
+
+
+class RecordLshBucket(Base):
+    """
+    LSH band buckets of a record's MinHash signature; records sharing a bucket are candidates.
+    """
+
+    __tablename__ = "record_lsh_buckets"
+
+    band: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    bucket: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    record_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("records.id", ondelete="CASCADE"), primary_key=True, index=True
+    )
+
+
+class FeedBucketCounter(Base):
+    """
+    Number of records per feed bucket, kept current by deltas written alongside status changes.
+    """
+
+    __tablename__ = "feed_bucket_counters"
+
+    bucket: Mapped[str] = mapped_column(String(32), primary_key=True)
+    record_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
@@ -0,0 +1,42 @@
+import base64
+import uuid
+from datetime import datetime
+
+from fastapi import HTTPException
+
+# Review requests per page on the case page and in the record detail API.
+REVIEWS_PAGE_SIZE = 20
+
+
+def encode_cursor(created_at: datetime, row_id: uuid.UUID) -> str:
+    """
+    Opaque keyset cursor for (created_at, id) ordered listings.
+    """
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), uuid.UUID(row_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def encode_score_cursor(score: float, row_id: uuid.UUID) -> str:
+    """
+    Opaque keyset cursor for (score, id) ordered listings; repr() round-trips the float exactly.
+    """
+    raw = f"{score!r}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_score_cursor(cursor: str) -> tuple[float, uuid.UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        score, row_id = raw.split("|", 1)
+        return float(score), uuid.UUID(row_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
@@ -0,0 +1,206 @@
+import logging
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.datastructures import MutableHeaders
+
+from .config import get_settings
+
+logger = logging.getLogger("truburn.profiling")
+
+F = TypeVar("F", bound=Callable)
+
+
+@dataclass
+class CapturedQuery:
+    statement: str
+    duration_ms: float
+
+
+@dataclass
+class RequestProfile:
+    started: float = field(default_factory=time.perf_counter)
+    queries: list[CapturedQuery] = field(default_factory=list)
+    spans: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    @property
+    def db_ms(self) -> float:
+        return sum(q.duration_ms for q in self.queries)
+
+    def server_timing(self) -> str:
+        parts = [f"{name};dur={ms:.1f}" for name, ms in self.spans.items()]
+        parts.append(f'db;dur={self.db_ms:.1f};desc="{len(self.queries)} queries"')
+        parts.append(f"total;dur={self.elapsed_ms:.1f}")
+        return ", ".join(parts)
+
+
+# Every active capture() on the current task; each statement is appended to all of them
+# so nested captures (a budget inside a request capture) both see it.
+_captures: ContextVar[tuple[list[CapturedQuery], ...]] = ContextVar("sql_captures", default=())
+_profile: ContextVar[RequestProfile | None] = ContextVar("request_profile", default=None)
+
+
+class QueryBudgetExceeded(AssertionError):
+    def __init__(self, label: str, budget: int, queries: list[CapturedQuery]):
+        self.label = label
+        self.budget = budget
+        self.queries = queries
+        listing = "\n".join(f"  {i}. {q.statement}" for i, q in enumerate(queries, 1))
+        super().__init__(f"{label}: {len(queries)} SQL statements exceed the budget of {budget}\n{listing}")
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _captures.get():
+        context._profiling_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    captures = _captures.get()
+    started = getattr(context, "_profiling_started", None)
+    if not captures or started is None:
+        return
+    query = CapturedQuery(statement, (time.perf_counter() - started) * 1000)
+    for captured in captures:
+        captured.append(query)
+
+
+def install_query_capture(engine: AsyncEngine) -> None:
+    """
+    Register the statement listeners on the engine. Cheap when nothing is capturing.
+    """
+    sync_engine = engine.sync_engine
+    for name, listener in (
+        ("before_cursor_execute", _before_cursor_execute),
+        ("after_cursor_execute", _after_cursor_execute),
+    ):
+        if not event.contains(sync_engine, name, listener):
+            event.listen(sync_engine, name, listener)
+
+
+@contextmanager
+def capture_queries() -> Iterator[list[CapturedQuery]]:
+    """
+    Collect SQL statements executed on the current task while the block runs.
+    """
+    captured: list[CapturedQuery] = []
+    token = _captures.set(_captures.get() + (captured,))
+    try:
+        yield captured
+    finally:
+        _captures.reset(token)
+
+
+@contextmanager
+def query_budget(max_queries: int, label: str = "block") -> Iterator[list[CapturedQuery]]:
+    """
+    Fail with QueryBudgetExceeded, listing the statements, if the block runs more than max_queries.
+    """
+    with capture_queries() as captured:
+        yield captured
+    if len(captured) > max_queries:
+        raise QueryBudgetExceeded(label, max_queries, captured)
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """
+    Time a phase of the current request; repeated spans with the same name accumulate.
+    No-op outside ProfilingMiddleware.
+    """
+    profile = _profile.get()
+    if profile is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.spans[name] = profile.spans.get(name, 0.0) + (time.perf_counter() - started) * 1000
+
+
+def declare_query_budget(max_queries: int) -> Callable[[F], F]:
+    """
+    Attach a per-request SQL statement budget to a route endpoint.
+    Place it below the router decorator so the router registers the tagged function.
+    """
+
+    def decorate(fn: F) -> F:
+        fn.__query_budget__ = max_queries
+        return fn
+
+    return decorate
+
+
+class ProfilingMiddleware:
+    """
+    Per-request SQL capture and phase spans.
+    - Adds a Server-Timing header (spans, db time/count, total) when SERVER_TIMING_ENABLED
+      (off by default: it tells any client how long each phase and the DB took).
+    - Checks the endpoint's declared query budget.
+      QUERY_BUDGET_MODE: off | warn (log) | raise (fail the request with a 500 before the
+      response starts; for tests and CI). Statements run while streaming a body are checked
+      after the response.
+    - Logs a sampled slow-request report with every statement and its duration
+      once SLOW_REQUEST_MS is exceeded.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        settings = get_settings()
+        self.budget_mode = settings.query_budget_mode
+        self.server_timing = settings.server_timing_enabled
+        self.slow_ms = settings.slow_request_ms
+        self.slow_sample_rate = settings.slow_request_sample_rate
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        profile = RequestProfile()
+        label = f"{scope['method']} {scope['path']}"
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                if self.budget_mode == "raise":
+                    # Fail before anything is sent so the request errors instead of just logging.
+                    self._check_budget(label, scope.get("endpoint"), profile.queries)
+                if self.server_timing:
+                    MutableHeaders(scope=message).append("Server-Timing", profile.server_timing())
+            await send(message)
+
+        token = _profile.set(profile)
+        try:
+            with capture_queries() as captured:
+                profile.queries = captured
+                await self.app(scope, receive, send_with_timing)
+        finally:
+            _profile.reset(token)
+        self._log_if_slow(label, profile)
+        self._check_budget(label, scope.get("endpoint"), captured)
+
+    def _log_if_slow(self, label: str, profile: RequestProfile) -> None:
+        elapsed = profile.elapsed_ms
+        if self.slow_ms <= 0 or elapsed < self.slow_ms or random.random() >= self.slow_sample_rate:
+            return
+        lines = [f"slow request {label}: {elapsed:.1f}ms ({profile.server_timing()})"]
+        lines += [f"  {q.duration_ms:8.1f}ms  {q.statement[:500]}" for q in profile.queries]
+        logger.warning("\n".join(lines))
+
+    def _check_budget(self, label: str, endpoint, captured: list[CapturedQuery]) -> None:
+        budget = getattr(endpoint, "__query_budget__", None)
+        if self.budget_mode == "off" or budget is None or len(captured) <= budget:
+            return
+        exc = QueryBudgetExceeded(label, budget, captured)
+        if self.budget_mode == "raise":
+            raise exc
+        logger.warning("%s", exc)
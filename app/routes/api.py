@@ -0,0 +1,169 @@
+import uuid
+from datetime import datetime
+from typing import Any, Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import Response, StreamingResponse
+from pydantic_core import to_json
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import get_settings
+from ..database import AsyncSessionLocal, get_session
+from ..deps import get_export_client
+from ..models import Record, RecordStatus, ReviewRequest
+from ..pagination import REVIEWS_PAGE_SIZE, decode_cursor, encode_cursor
+from ..schemas import RecordBatchRead, RecordDetailRead, RecordPage, RecordRead, ReviewRequestRead
+from ..services.export import ExportFilter, export_archive
+from ..services.rate_limit import SlidingWindowLimiter
+from ..services.review import finalize_expired_reviews
+
+router = APIRouter(prefix="/api", tags=["api"])
+
+MAX_PAGE_SIZE = 100
+MAX_BATCH_IDS = 100
+EXPORT_RATE_WINDOW_SECONDS = 3600
+
+# Exports hold a DB cursor for the whole stream, so each client gets a few per hour.
+export_limiter = SlidingWindowLimiter(get_settings().export_rate_limit, EXPORT_RATE_WINDOW_SECONDS)
+
+# Rows are selected straight into the Read schemas' shape and serialized with
+# pydantic-core, skipping ORM hydration and per-object model validation.
+RECORD_COLUMNS = [getattr(Record, name) for name in RecordRead.model_fields]
+REVIEW_REQUEST_COLUMNS = [getattr(ReviewRequest, name) for name in ReviewRequestRead.model_fields]
+
+
+def _json(payload: Any) -> Response:
+    return Response(content=to_json(payload), media_type="application/json")
+
+
+@router.get("/records", response_model=RecordPage)
+async def list_records(
+    status: list[RecordStatus] | None = Query(None),
+    occurred_from: datetime | None = None,
+    occurred_to: datetime | None = None,
+    cursor: str | None = None,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    session: AsyncSession = Depends(get_session),
+) -> Response:
+    """
+    Records newest first, keyset-paginated on (created_at, id).
+    The occurrence filters match records whose time window overlaps [occurred_from, occurred_to].
+    """
+    await finalize_expired_reviews(session)
+    stmt = select(*RECORD_COLUMNS).order_by(Record.created_at.desc(), Record.id.desc()).limit(limit + 1)
+    if status:
+        stmt = stmt.where(Record.status.in_(status))
+    if occurred_from:
+        stmt = stmt.where(Record.time_occurred_end >= occurred_from)
+    if occurred_to:
+        stmt = stmt.where(Record.time_occurred_start <= occurred_to)
+    if cursor:
+        stmt = stmt.where(tuple_(Record.created_at, Record.id) < decode_cursor(cursor))
+    result = await session.execute(stmt)
+    items = [dict(row) for row in result.mappings()]
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        next_cursor = encode_cursor(items[-1]["created_at"], items[-1]["id"])
+    return _json({"items": items, "next_cursor": next_cursor})
+
+
+@router.get("/records:batchGet", response_model=RecordBatchRead)
+async def batch_get_records(
+    ids: list[uuid.UUID] = Query(...),
+    session: AsyncSession = Depends(get_session),
+) -> Response:
+    """
+    Fetch up to MAX_BATCH_IDS records in one query, returned in request order.
+    """
+    if len(ids) > MAX_BATCH_IDS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_IDS} ids per batch")
+    await finalize_expired_reviews(session)
+    result = await session.execute(select(*RECORD_COLUMNS).where(Record.id.in_(ids)))
+    found = {row["id"]: dict(row) for row in result.mappings()}
+    ordered = list(dict.fromkeys(ids))
+    return _json(
+        {
+            "records": [found[i] for i in ordered if i in found],
+            "missing": [i for i in ordered if i not in found],
+        }
+    )
+
+
+@router.get("/records/{record_id}", response_model=RecordDetailRead)
+async def get_record(
+    record_id: uuid.UUID,
+    reviews_before: str | None = None,
+    session: AsyncSession = Depends(get_session),
+) -> Response:
+    """
+    One record with a page of its review requests, newest first; follow next_reviews_cursor
+    (as reviews_before) for older ones.
+    """
+    await finalize_expired_reviews(session)
+    result = await session.execute(select(*RECORD_COLUMNS).where(Record.id == record_id))
+    row = result.mappings().first()
+    if not row:
+        raise HTTPException(status_code=404, detail="Record not found")
+    rr_stmt = (
+        select(*REVIEW_REQUEST_COLUMNS)
+        .where(ReviewRequest.record_id == record_id)
+        .order_by(ReviewRequest.created_at.desc(), ReviewRequest.id.desc())
+        .limit(REVIEWS_PAGE_SIZE + 1)
+    )
+    if reviews_before:
+        rr_stmt = rr_stmt.where(tuple_(ReviewRequest.created_at, ReviewRequest.id) < decode_cursor(reviews_before))
+    rr_result = await session.execute(rr_stmt)
+    review_requests = [dict(rr) for rr in rr_result.mappings()]
+    next_reviews_cursor = None
+    if len(review_requests) > REVIEWS_PAGE_SIZE:
+        review_requests = review_requests[:REVIEWS_PAGE_SIZE]
+        next_reviews_cursor = encode_cursor(review_requests[-1]["created_at"], review_requests[-1]["id"])
+    return _json({**row, "review_requests": review_requests, "next_reviews_cursor": next_reviews_cursor})
+
+
+@router.get("/exports/archive")
+async def export_archived_records(
+    fmt: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    gzip: bool = False,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+    occurred_from: datetime | None = None,
+    occurred_to: datetime | None = None,
+    cursor: str | None = None,
+    client: str = Depends(get_export_client),
+) -> StreamingResponse:
+    """
+    Stream verified/falsified records with their review requests, oldest first.
+    Each NDJSON line / each record's last CSV row carries a cursor; pass the last one back to resume.
+    Requires an EXPORT_API_TOKENS Bearer token or a login, and is limited to EXPORT_RATE_LIMIT per hour.
+    """
+    filters = ExportFilter(
+        created_from=created_from,
+        created_to=created_to,
+        occurred_from=occurred_from,
+        occurred_to=occurred_to,
+        after=decode_cursor(cursor) if cursor else None,
+    )
+    retry_after = export_limiter.hit(client)
+    if retry_after is not None:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Export rate limit exceeded",
+            headers={"Retry-After": str(int(retry_after) + 1)},
+        )
+
+    async def body():
+        # Own session: request-scoped dependencies are closed before the body is streamed.
+        async with AsyncSessionLocal() as session:
+            async for chunk in export_archive(session, filters, fmt=fmt, gzip=gzip):
+                yield chunk
+
+    filename = f"truburn-archive.{fmt}" + (".gz" if gzip else "")
+    media_type = "application/gzip" if gzip else ("text/csv" if fmt == "csv" else "application/x-ndjson")
+    return StreamingResponse(
+        body(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
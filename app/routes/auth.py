@@ -9,6 +9,7 @@ from ..config import get_settings
 from ..database import get_session
 from ..deps import get_optional_user
 from ..models import User
+from ..services.leaderboard import leaderboard
 
 router = APIRouter()
 templates = Jinja2Templates(directory="app/templates")
@@ -43,6 +44,7 @@ async def mock_login(
     user.last_login_at = datetime.now(timezone.utc)
     session.add(user)
     await session.commit()
+    leaderboard.observe("vp", user.id, user.display_name, user.vp_balance)
     request.session["user_id"] = str(user.id)
     return RedirectResponse(url="/onboarding", status_code=303)
 
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
 from sqlalchemy import select
@@ -7,6 +7,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from ..database import get_session
 from ..deps import get_current_user, get_optional_user
 from ..models import Record, ReviewRequest, VerificationPoint
+from ..profiling import declare_query_budget
+from ..services.leaderboard import BOARDS, LEADERBOARD_SIZE, PAGE_SIZE, leaderboard
 
 router = APIRouter()
 templates = Jinja2Templates(directory="app/templates")
@@ -26,6 +28,7 @@ async def onboarding(
 
 
 @router.get("/vault", response_class=HTMLResponse)
+@declare_query_budget(4)
 async def vault(
     request: Request,
     session: AsyncSession = Depends(get_session),
@@ -61,6 +64,33 @@ async def vault(
     )
 
 
+@router.get("/leaderboard", response_class=HTMLResponse)
+@declare_query_budget(2)
+async def leaderboard_page(
+    request: Request,
+    board: str = "vp",
+    page: int = Query(1, ge=1),
+    session: AsyncSession = Depends(get_session),
+    current_user=Depends(get_optional_user),
+) -> HTMLResponse:
+    if board not in BOARDS:
+        raise HTTPException(status_code=404, detail="Leaderboard not found")
+    entries, has_next = await leaderboard.page(session, board, page)
+    return templates.TemplateResponse(
+        "leaderboard.html",
+        {
+            "request": request,
+            "board": board,
+            "page": page,
+            "entries": entries,
+            "first_rank": (page - 1) * PAGE_SIZE + 1,
+            "has_next": has_next,
+            "size": LEADERBOARD_SIZE,
+            "current_user": current_user,
+        },
+    )
+
+
 @router.get("/about", response_class=HTMLResponse)
 async def about(request: Request, current_user=Depends(get_optional_user)) -> HTMLResponse:
     return templates.TemplateResponse(
@@ -3,65 +3,104 @@ from datetime import datetime, timedelta, timezone
 from fastapi import APIRouter, Depends, Form, HTTPException, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
-from sqlalchemy import select
+from sqlalchemy import select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
 from ..config import get_settings
 from ..database import get_session
 from ..deps import get_current_user, get_optional_user
 from ..models import (
     Record,
+    RecordFingerprint,
     RecordStatus,
     ReviewRequest,
     ReviewRequestStatus,
     VerificationPoint,
 )
+from ..pagination import (
+    REVIEWS_PAGE_SIZE,
+    decode_cursor,
+    decode_score_cursor,
+    encode_cursor,
+    encode_score_cursor,
+)
+from ..profiling import declare_query_budget, span
 from ..schemas import RecordCreate, ReviewRequestCreate
 from ..services.analysis import simple_5w1h
+from ..services.duplicates import (
+    find_duplicates_of_record,
+    find_possible_duplicates,
+    index_records,
+    text_signature,
+)
+from ..services.evidence import load_link_checks, register_evidence_urls
+from ..services.feed_counters import FEED_BUCKETS, load_bucket_counts, record_status_change
+from ..services.hot import HOT_PAGE_SIZE, hot_feed_query, hot_score
+from ..services.leaderboard import leaderboard
 from ..services.resolution import calc_resolution_window, compute_resolution_level, resolution_multiplier
 from ..services.review import finalize_expired_reviews
+from ..services.snapshots import snapshot_path, snapshot_response
 
 router = APIRouter()
 templates = Jinja2Templates(directory="app/templates")
 settings = get_settings()
 
 
-async def fetch_record(session: AsyncSession, record_id: uuid.UUID) -> Record:
-    record = await session.get(Record, record_id)
+
+async def fetch_record(session: AsyncSession, record_id: uuid.UUID, for_update: bool = False) -> Record:
+    # None (not False) keeps session.get's identity-map shortcut for plain reads.
+    record = await session.get(Record, record_id, with_for_update=True if for_update else None)
     if not record:
         raise HTTPException(status_code=404, detail="Record not found")
     return record
 
 
 @router.get("/feed/{bucket}", response_class=HTMLResponse)
+@declare_query_budget(9)
 async def feed(
     request: Request,
     bucket: str,
+    sort: str = "new",
+    cursor: str | None = None,
     session: AsyncSession = Depends(get_session),
     current_user=Depends(get_optional_user),
 ) -> HTMLResponse:
-    await finalize_expired_reviews(session)
-    mapping = {
-        "live": [RecordStatus.live],
-        "investigating": [RecordStatus.under_review],
-        "archive": [RecordStatus.verified, RecordStatus.falsified],
-    }
-    if bucket not in mapping:
+    with span("finalize"):
+        await finalize_expired_reviews(session)
+    if bucket not in FEED_BUCKETS:
         raise HTTPException(status_code=404, detail="Feed not found")
-    result = await session.execute(
-        select(Record).where(Record.status.in_(mapping[bucket])).order_by(Record.created_at.desc())
-    )
+    if sort not in ("new", "hot"):
+        raise HTTPException(status_code=400, detail="Unknown sort")
+    next_cursor = None
+    if sort == "hot":
+        # Keyset over the (status, hot_score, id) index; unscored rows wait for refresh_hot_scores.
+        after = decode_score_cursor(cursor) if cursor else None
+        query = hot_feed_query(FEED_BUCKETS[bucket], after, HOT_PAGE_SIZE + 1)
+    else:
+        query = select(Record).where(Record.status.in_(FEED_BUCKETS[bucket])).order_by(Record.created_at.desc())
+    result = await session.execute(query)
     records = result.scalars().all()
-    return templates.TemplateResponse(
-        "records/feed.html",
-        {
-            "request": request,
-            "bucket": bucket,
-            "records": records,
-            "analysis": {r.id: simple_5w1h(r.body) for r in records},
-            "current_user": current_user,
-        },
-    )
+    if sort == "hot" and len(records) > HOT_PAGE_SIZE:
+        records = records[:HOT_PAGE_SIZE]
+        next_cursor = encode_score_cursor(records[-1].hot_score, records[-1].id)
+    bucket_counts = await load_bucket_counts(session)
+    with span("analysis"):
+        analysis = {r.id: simple_5w1h(r.body) for r in records}
+    with span("render"):
+        return templates.TemplateResponse(
+            "records/feed.html",
+            {
+                "request": request,
+                "bucket": bucket,
+                "sort": sort,
+                "next_cursor": next_cursor,
+                "bucket_counts": bucket_counts,
+                "records": records,
+                "analysis": analysis,
+                "current_user": current_user,
+            },
+        )
 
 
 @router.get("/report", response_class=HTMLResponse)
@@ -92,6 +131,7 @@ async def report_form(
 
 
 @router.post("/records")
+@declare_query_budget(6)
 async def create_record(
     request: Request,
     title: str = Form(...),
@@ -122,40 +162,138 @@ async def create_record(
         resolution_multiplier=resolution_multiplier(level),
         status=RecordStatus.live,
         created_by=current_user.id,
+        # created_at is assigned by the DB; the few ms of difference do not matter for ranking.
+        hot_score=hot_score(resolution_multiplier(level), 0, datetime.now(timezone.utc)),
+        hot_score_stale=False,
     )
     session.add(record)
+    await session.flush()
+    await index_records(session, [record])
+    await record_status_change(session, None, record.status)
+    await register_evidence_urls(session, [record.evidence_url])
     await session.commit()
     return RedirectResponse(url=f"/case/{record.id}", status_code=303)
 
 
 @router.get("/case/{record_id}", response_class=HTMLResponse)
+@declare_query_budget(11)
 async def record_detail(
     request: Request,
     record_id: uuid.UUID,
+    reviews_before: str | None = None,
     session: AsyncSession = Depends(get_session),
-    current_user=Depends(get_optional_user),
 ) -> HTMLResponse:
-    await finalize_expired_reviews(session)
-    record = await fetch_record(session, record_id)
-    analysis = simple_5w1h(record.body)
+    # Finalized cases only change in the panels served by record_panels: anonymous visitors get
+    # the pre-rendered snapshot without touching the DB. Logged-in users need their own header.
+    if reviews_before is None and "user_id" not in request.session:
+        snapshot = await snapshot_response(request, snapshot_path(record_id))
+        if snapshot is not None:
+            return snapshot
+    current_user = await get_optional_user(request, session)
+    with span("finalize"):
+        await finalize_expired_reviews(session)
     result = await session.execute(
-        select(ReviewRequest).where(ReviewRequest.record_id == record.id).order_by(ReviewRequest.created_at.desc())
+        select(Record, RecordFingerprint.minhash)
+        .options(joinedload(Record.author))
+        .outerjoin(RecordFingerprint, RecordFingerprint.record_id == Record.id)
+        .where(Record.id == record_id)
     )
+    row = result.one_or_none()
+    if not row:
+        raise HTTPException(status_code=404, detail="Record not found")
+    record, signature = row
+    with span("analysis"):
+        analysis = simple_5w1h(record.body)
+    rr_query = (
+        select(ReviewRequest)
+        .options(joinedload(ReviewRequest.requester))
+        .where(ReviewRequest.record_id == record.id)
+        .order_by(ReviewRequest.created_at.desc(), ReviewRequest.id.desc())
+        .limit(REVIEWS_PAGE_SIZE + 1)
+    )
+    if reviews_before:
+        rr_query = rr_query.where(
+            tuple_(ReviewRequest.created_at, ReviewRequest.id) < decode_cursor(reviews_before)
+        )
+    result = await session.execute(rr_query)
     review_requests = result.scalars().all()
+    next_reviews_cursor = None
+    if len(review_requests) > REVIEWS_PAGE_SIZE:
+        review_requests = review_requests[:REVIEWS_PAGE_SIZE]
+        next_reviews_cursor = encode_cursor(review_requests[-1].created_at, review_requests[-1].id)
+    link_checks = await load_link_checks(
+        session, [record.evidence_url, *(rr.evidence_url for rr in review_requests)]
+    )
+    with span("duplicates"):
+        duplicates = await find_duplicates_of_record(session, record, signature)
+    with span("render"):
+        return templates.TemplateResponse(
+            "records/detail.html",
+            {
+                "request": request,
+                "record": record,
+                "analysis": analysis,
+                "review_requests": review_requests,
+                "reviews_before": reviews_before,
+                "next_reviews_cursor": next_reviews_cursor,
+                "link_checks": link_checks,
+                "duplicates": duplicates,
+                "default_resolution_hours": settings.review_request_duration_hours,
+                "current_user": current_user,
+            },
+        )
+
+
+@router.get("/case/{record_id}/panels", response_class=HTMLResponse)
+@declare_query_budget(4)
+async def record_panels(
+    request: Request,
+    record_id: uuid.UUID,
+    reviews_before: str | None = None,
+    session: AsyncSession = Depends(get_session),
+) -> HTMLResponse:
+    """
+    Possible duplicates plus out-of-band link-check badges for a snapshotted case page.
+    Badges cover the same page of review requests the page itself shows.
+    """
+    result = await session.execute(
+        select(Record, RecordFingerprint.minhash)
+        .outerjoin(RecordFingerprint, RecordFingerprint.record_id == Record.id)
+        .where(Record.id == record_id)
+    )
+    row = result.one_or_none()
+    if not row:
+        raise HTTPException(status_code=404, detail="Record not found")
+    record, signature = row
+    rr_query = (
+        select(ReviewRequest.id, ReviewRequest.evidence_url)
+        .where(ReviewRequest.record_id == record.id)
+        .order_by(ReviewRequest.created_at.desc(), ReviewRequest.id.desc())
+        .limit(REVIEWS_PAGE_SIZE)
+    )
+    if reviews_before:
+        rr_query = rr_query.where(
+            tuple_(ReviewRequest.created_at, ReviewRequest.id) < decode_cursor(reviews_before)
+        )
+    rr_result = await session.execute(rr_query)
+    review_evidence = rr_result.all()
+    link_checks = await load_link_checks(session, [record.evidence_url, *(url for _, url in review_evidence)])
+    with span("duplicates"):
+        duplicates = await find_duplicates_of_record(session, record, signature)
     return templates.TemplateResponse(
-        "records/detail.html",
+        "partials/case_panels.html",
         {
             "request": request,
             "record": record,
-            "analysis": analysis,
-            "review_requests": review_requests,
-            "default_resolution_hours": settings.review_request_duration_hours,
-            "current_user": current_user,
+            "review_evidence": review_evidence,
+            "link_checks": link_checks,
+            "duplicates": duplicates,
         },
     )
 
 
 @router.post("/case/{record_id}/review-requests")
+@declare_query_budget(8)
 async def create_review_request(
     request: Request,
     record_id: uuid.UUID,
@@ -165,7 +303,8 @@ async def create_review_request(
     session: AsyncSession = Depends(get_session),
     current_user=Depends(get_current_user),
 ):
-    record = await fetch_record(session, record_id)
+    # Locked so the status transition below cannot race with the finalizer's.
+    record = await fetch_record(session, record_id, for_update=True)
     if record.status in (RecordStatus.verified, RecordStatus.falsified):
         raise HTTPException(status_code=400, detail="Record already finalized")
     if len(reason.strip()) < 200:
@@ -183,7 +322,10 @@ async def create_review_request(
         expires_at=expires_at,
         vp_cost=1,
     )
+    if record.status != RecordStatus.under_review:
+        await record_status_change(session, record.status, RecordStatus.under_review)
     record.status = RecordStatus.under_review
+    record.hot_score_stale = True
     current_user.vp_balance -= review_request.vp_cost
     tx = VerificationPoint(
         user_id=current_user.id,
@@ -192,7 +334,9 @@ async def create_review_request(
         note="Review Request consumption",
     )
     session.add_all([review_request, tx])
+    await register_evidence_urls(session, [review_request.evidence_url])
     await session.commit()
+    leaderboard.observe("vp", current_user.id, current_user.display_name, current_user.vp_balance)
     return RedirectResponse(url=f"/case/{record.id}", status_code=303)
 
 
@@ -219,6 +363,28 @@ async def resolution_preview(
     )
 
 
+@router.post("/records/duplicate-check", response_class=HTMLResponse)
+async def duplicate_check(
+    request: Request,
+    title: str = Form("", max_length=200),
+    body: str = Form(""),
+    session: AsyncSession = Depends(get_session),
+    current_user=Depends(get_current_user),
+) -> HTMLResponse:
+    duplicates = []
+    if len(title) + len(body) >= 40:
+        # minhash_signature() only hashes the first SIGNATURE_MAX_CHARS, so long bodies cost no more.
+        signature = await text_signature(title, body)
+        duplicates = await find_possible_duplicates(session, signature)
+    return templates.TemplateResponse(
+        "partials/possible_duplicates.html",
+        {
+            "request": request,
+            "duplicates": duplicates,
+        },
+    )
+
+
 def _parse_dt(value: str | None) -> datetime:
     if not value:
         raise HTTPException(status_code=400, detail="Datetime required")
@@ -54,3 +54,18 @@ class ReviewRequestRead(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class RecordPage(BaseModel):
+    items: list[RecordRead]
+    next_cursor: Optional[str] = None
+
+
+class RecordDetailRead(RecordRead):
+    review_requests: list[ReviewRequestRead]
+    next_reviews_cursor: Optional[str] = None
+
+
+class RecordBatchRead(BaseModel):
+    records: list[RecordRead]
+    missing: list[uuid.UUID]
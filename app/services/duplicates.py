@@ -0,0 +1,141 @@
+import hashlib
+import random
+import re
+import unicodedata
+import uuid
+import zlib
+from dataclasses import dataclass
+from typing import Iterable
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import Record, RecordFingerprint, RecordLshBucket
+
+# 64 MinHash permutations split into 16 bands of 4 rows: two texts share a bucket
+# with probability 1 - (1 - J^4)^16, i.e. ~50% at Jaccard 0.5 and >99% at 0.8.
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+SHINGLE_SIZE = 4
+_PRIME = (1 << 61) - 1
+_rng = random.Random(20261019)
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+
+# Hashing is pure Python and linear in text length; only the head of long bodies is used.
+SIGNATURE_MAX_CHARS = 2000
+DEFAULT_THRESHOLD = 0.5
+MAX_CANDIDATES = 20
+
+
+@dataclass
+class PossibleDuplicate:
+    record: Record
+    similarity: float
+
+
+def _shingles(text: str) -> set[int]:
+    # Character shingles work for both Japanese and space-delimited text.
+    normalized = re.sub(r"\s+", " ", unicodedata.normalize("NFKC", text).lower()).strip()
+    if len(normalized) <= SHINGLE_SIZE:
+        return {zlib.crc32(normalized.encode())}
+    return {
+        zlib.crc32(normalized[i : i + SHINGLE_SIZE].encode())
+        for i in range(len(normalized) - SHINGLE_SIZE + 1)
+    }
+
+
+def minhash_signature(title: str, body: str) -> list[int]:
+    hashes = _shingles(f"{title} {body}"[:SIGNATURE_MAX_CHARS])
+    return [min([(a * h + b) % _PRIME for h in hashes]) for a, b in _PERMUTATIONS]
+
+
+async def text_signature(title: str, body: str) -> list[int]:
+    """
+    minhash_signature() in a worker thread so it does not block the event loop.
+    """
+    return await run_in_threadpool(minhash_signature, title, body)
+
+
+def band_keys(signature: list[int]) -> list[tuple[int, int]]:
+    """
+    (band, bucket) pairs; bucket is a signed 64-bit digest of the band's rows.
+    """
+    keys = []
+    for band in range(BANDS):
+        rows = signature[band * ROWS : (band + 1) * ROWS]
+        digest = hashlib.blake2b(repr(rows).encode(), digest_size=8).digest()
+        keys.append((band, int.from_bytes(digest, "big", signed=True)))
+    return keys
+
+
+def estimate_similarity(a: list[int], b: list[int]) -> float:
+    return sum(x == y for x, y in zip(a, b)) / NUM_PERM
+
+
+async def index_records(session: AsyncSession, records: Iterable[Record]) -> None:
+    """
+    Write fingerprints and LSH buckets for flushed, not yet indexed records.
+    Does not commit; callers index inside their own transaction.
+    """
+    records = list(records)
+    if not records:
+        return
+    signatures = await run_in_threadpool(lambda: [minhash_signature(r.title, r.body) for r in records])
+    fingerprints = []
+    buckets = []
+    for record, signature in zip(records, signatures):
+        fingerprints.append({"record_id": record.id, "minhash": signature})
+        buckets.extend(
+            {"band": band, "bucket": bucket, "record_id": record.id} for band, bucket in band_keys(signature)
+        )
+    await session.execute(RecordFingerprint.__table__.insert(), fingerprints)
+    await session.execute(RecordLshBucket.__table__.insert(), buckets)
+
+
+async def find_possible_duplicates(
+    session: AsyncSession,
+    signature: list[int],
+    exclude_id: uuid.UUID | None = None,
+    limit: int = 5,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[PossibleDuplicate]:
+    """
+    Records sharing at least one LSH bucket with the signature, ranked by estimated Jaccard
+    similarity. Cost depends on bucket sizes, not on the number of indexed records.
+    """
+    candidates = (
+        select(RecordLshBucket.record_id, func.count().label("hits"))
+        .where(tuple_(RecordLshBucket.band, RecordLshBucket.bucket).in_(band_keys(signature)))
+        .group_by(RecordLshBucket.record_id)
+        .order_by(func.count().desc())
+        .limit(MAX_CANDIDATES)
+    )
+    if exclude_id is not None:
+        candidates = candidates.where(RecordLshBucket.record_id != exclude_id)
+    candidates = candidates.subquery()
+    result = await session.execute(
+        select(Record, RecordFingerprint.minhash)
+        .join(candidates, candidates.c.record_id == Record.id)
+        .join(RecordFingerprint, RecordFingerprint.record_id == Record.id)
+    )
+    matches = [
+        PossibleDuplicate(record=record, similarity=estimate_similarity(signature, minhash))
+        for record, minhash in result
+    ]
+    matches = [m for m in matches if m.similarity >= threshold]
+    matches.sort(key=lambda m: m.similarity, reverse=True)
+    return matches[:limit]
+
+
+async def find_duplicates_of_record(
+    session: AsyncSession, record: Record, signature: list[int] | None
+) -> list[PossibleDuplicate]:
+    """
+    Possible duplicates of an indexed record, reusing its stored signature (pass
+    RecordFingerprint.minhash); records not indexed yet are hashed off the event loop.
+    """
+    if signature is None:
+        signature = await text_signature(record.title, record.body)
+    return await find_possible_duplicates(session, signature, exclude_id=record.id)
@@ -0,0 +1,220 @@
+import asyncio
+import ipaddress
+import socket
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Iterable
+
+import httpcore
+import httpx
+from sqlalchemy import select, union
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import get_settings
+from ..models import EvidenceLinkCheck, Record, ReviewRequest
+
+RECHECK_OK = timedelta(days=7)
+RETRY_BASE = timedelta(hours=1)
+RETRY_MAX = timedelta(days=7)
+CLAIM_LEASE = timedelta(hours=1)
+USER_AGENT = "TruburnEvidenceChecker/0.1"
+
+
+@dataclass
+class LinkResult:
+    status_code: int | None = None
+    final_url: str | None = None
+    error: str | None = None
+
+
+async def register_evidence_urls(session: AsyncSession, urls: Iterable[str | None]) -> None:
+    """
+    Queue URLs for checking. Existing entries keep their schedule.
+    """
+    values = [{"url": url} for url in dict.fromkeys(u for u in urls if u)]
+    if values:
+        await session.execute(insert(EvidenceLinkCheck).values(values).on_conflict_do_nothing())
+
+
+async def discover_evidence_urls(session: AsyncSession) -> None:
+    """
+    Backfill the queue from records and review requests created before registration existed.
+    """
+    known = select(EvidenceLinkCheck.url)
+    sources = union(
+        select(Record.evidence_url).where(Record.evidence_url.is_not(None)),
+        select(ReviewRequest.evidence_url),
+    ).subquery()
+    await session.execute(
+        insert(EvidenceLinkCheck)
+        .from_select(["url"], select(sources.c.evidence_url).where(sources.c.evidence_url.not_in(known)))
+        .on_conflict_do_nothing()
+    )
+    await session.commit()
+
+
+async def load_link_checks(session: AsyncSession, urls: Iterable[str | None]) -> dict[str, EvidenceLinkCheck]:
+    """
+    Cached check results for the given URLs; never touches the network.
+    """
+    wanted = {u for u in urls if u}
+    if not wanted:
+        return {}
+    result = await session.execute(select(EvidenceLinkCheck).where(EvidenceLinkCheck.url.in_(wanted)))
+    return {check.url: check for check in result.scalars()}
+
+
+async def _resolve(host: str, port: int) -> list[str]:
+    infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    return [info[4][0] for info in infos]
+
+
+def _is_public(address: str) -> bool:
+    return ipaddress.ip_address(address).is_global
+
+
+class _PublicOnlyBackend(httpcore.AsyncNetworkBackend):
+    """
+    Resolves the host once, refuses it if any address is non-public, and connects to an address
+    it checked, so a second DNS answer (rebinding) cannot redirect the connection. TLS SNI and
+    the Host header still use the hostname. Every hop of a redirect opens its connection here.
+    """
+
+    def __init__(self):
+        self._backend = httpcore.AnyIOBackend()
+
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        try:
+            addresses = await asyncio.wait_for(_resolve(host, port), timeout)
+        except (OSError, asyncio.TimeoutError) as exc:
+            raise httpcore.ConnectError(f"Cannot resolve {host}") from exc
+        if not addresses or not all(_is_public(address) for address in addresses):
+            raise httpcore.ConnectError(f"{host} resolves to non-public address")
+        return await self._backend.connect_tcp(
+            addresses[0], port, timeout=timeout, local_address=local_address, socket_options=socket_options
+        )
+
+    async def connect_unix_socket(self, path, timeout=None, socket_options=None):
+        raise httpcore.ConnectError("Unix sockets are not allowed")
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+class _PublicOnlyTransport(httpx.AsyncHTTPTransport):
+    def __init__(self, limits: httpx.Limits):
+        super().__init__(limits=limits, trust_env=False)
+        # AsyncHTTPTransport takes no network backend, so build its pool with ours.
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=httpx.create_ssl_context(trust_env=False),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            network_backend=_PublicOnlyBackend(),
+        )
+
+
+def make_client() -> httpx.AsyncClient:
+    """
+    One pooled client for a whole checker run; connections are reused per host.
+    """
+    settings = get_settings()
+    limits = httpx.Limits(
+        max_connections=settings.evidence_check_concurrency,
+        max_keepalive_connections=settings.evidence_check_concurrency,
+    )
+    transport = None if settings.evidence_check_allow_private else _PublicOnlyTransport(limits)
+    return httpx.AsyncClient(
+        follow_redirects=True,
+        timeout=settings.evidence_check_timeout_seconds,
+        limits=limits,
+        transport=transport,
+        headers={"User-Agent": USER_AGENT},
+    )
+
+
+async def check_url(client: httpx.AsyncClient, url: str) -> LinkResult:
+    """
+    HEAD the URL (falling back to GET for servers that reject HEAD) without reading the body.
+    """
+    try:
+        if httpx.URL(url).scheme not in ("http", "https"):
+            return LinkResult(error="Unsupported URL scheme")
+        resp = await client.head(url)
+        if resp.status_code in (403, 405, 501):
+            async with client.stream("GET", url) as resp:
+                pass
+        return LinkResult(status_code=resp.status_code, final_url=str(resp.url))
+    except (httpx.HTTPError, httpx.InvalidURL, OSError) as exc:
+        return LinkResult(error=(str(exc) or type(exc).__name__)[:200])
+
+
+def _apply_result(check: EvidenceLinkCheck, result: LinkResult, now: datetime) -> None:
+    check.status_code = result.status_code
+    check.final_url = result.final_url[:2000] if result.final_url else None
+    check.error = result.error
+    check.checked_at = now
+    if check.is_ok:
+        check.failure_count = 0
+        check.next_check_at = now + RECHECK_OK
+    else:
+        check.failure_count += 1
+        check.next_check_at = now + min(RETRY_BASE * 2 ** (check.failure_count - 1), RETRY_MAX)
+
+
+async def check_urls(client: httpx.AsyncClient, urls: list[str]) -> list[LinkResult]:
+    """
+    Check URLs concurrently, bounded by evidence_check_concurrency overall and by
+    evidence_check_per_host per hostname. Results are in input order.
+    """
+    settings = get_settings()
+    overall = asyncio.Semaphore(settings.evidence_check_concurrency)
+    per_host: defaultdict[str, asyncio.Semaphore] = defaultdict(
+        lambda: asyncio.Semaphore(settings.evidence_check_per_host)
+    )
+
+    async def run(url: str) -> LinkResult:
+        try:
+            host = httpx.URL(url).host
+        except httpx.InvalidURL:
+            return LinkResult(error="Invalid URL")
+        async with per_host[host], overall:
+            return await check_url(client, url)
+
+    return await asyncio.gather(*(run(url) for url in urls))
+
+
+async def check_due_links(
+    session: AsyncSession,
+    client: httpx.AsyncClient,
+    now: datetime | None = None,
+    limit: int | None = None,
+) -> int:
+    """
+    Check evidence URLs whose next_check_at has passed. Returns the number checked.
+    Due rows are claimed by pushing next_check_at out by CLAIM_LEASE and committing, so no
+    transaction stays open during the HTTP checks; results are written in a second one.
+    A run that dies mid-way leaves its rows to be picked up again once the lease expires.
+    """
+    settings = get_settings()
+    now = now or datetime.now(timezone.utc)
+    result = await session.execute(
+        select(EvidenceLinkCheck)
+        .where(EvidenceLinkCheck.next_check_at <= now)
+        .order_by(EvidenceLinkCheck.next_check_at)
+        .limit(limit or settings.evidence_check_batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    checks = result.scalars().all()
+    for check in checks:
+        check.next_check_at = now + CLAIM_LEASE
+    await session.commit()
+    if not checks:
+        return 0
+    results = await check_urls(client, [check.url for check in checks])
+    for check, link_result in zip(checks, results):
+        _apply_result(check, link_result, now)
+    await session.commit()
+    return len(checks)
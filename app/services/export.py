@@ -0,0 +1,142 @@
+import csv
+import io
+import uuid
+import zlib
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, AsyncIterator
+
+from pydantic_core import to_json
+from sqlalchemy import Select, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import Record, ReviewRequest
+from ..pagination import encode_cursor
+from ..schemas import RecordRead, ReviewRequestRead
+from .feed_counters import FEED_BUCKETS
+
+EXPORT_FORMATS = ("ndjson", "csv")
+ROWS_PER_FETCH = 1000
+CHUNK_BYTES = 64 * 1024
+
+RECORD_FIELDS = list(RecordRead.model_fields)
+REVIEW_FIELDS = list(ReviewRequestRead.model_fields)
+CSV_HEADER = ["cursor", *RECORD_FIELDS, *(f"review_{name}" for name in REVIEW_FIELDS)]
+
+
+@dataclass
+class ExportFilter:
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+    occurred_from: datetime | None = None
+    occurred_to: datetime | None = None
+    after: tuple[datetime, uuid.UUID] | None = None
+
+
+def _archive_query(filters: ExportFilter) -> Select:
+    """
+    Finalized records joined with their review requests, ordered so that each record's
+    rows are contiguous and the (created_at, id) keyset can resume an interrupted export.
+    """
+    stmt = (
+        select(
+            *(getattr(Record, name).label(name) for name in RECORD_FIELDS),
+            *(getattr(ReviewRequest, name).label(f"review_{name}") for name in REVIEW_FIELDS),
+        )
+        .outerjoin(ReviewRequest, ReviewRequest.record_id == Record.id)
+        .where(Record.status.in_(FEED_BUCKETS["archive"]))
+        .order_by(Record.created_at, Record.id, ReviewRequest.created_at, ReviewRequest.id)
+    )
+    if filters.created_from:
+        stmt = stmt.where(Record.created_at >= filters.created_from)
+    if filters.created_to:
+        stmt = stmt.where(Record.created_at < filters.created_to)
+    if filters.occurred_from:
+        stmt = stmt.where(Record.time_occurred_end >= filters.occurred_from)
+    if filters.occurred_to:
+        stmt = stmt.where(Record.time_occurred_start <= filters.occurred_to)
+    if filters.after:
+        stmt = stmt.where(tuple_(Record.created_at, Record.id) > filters.after)
+    return stmt
+
+
+async def iter_archived_records(session: AsyncSession, filters: ExportFilter) -> AsyncIterator[dict[str, Any]]:
+    """
+    Yield one dict per record with its review_requests and a resume cursor, reading through
+    a server-side cursor so memory stays bounded by ROWS_PER_FETCH and one record's reviews.
+    """
+    result = await session.stream(
+        _archive_query(filters).execution_options(yield_per=ROWS_PER_FETCH)
+    )
+    current: dict[str, Any] | None = None
+    async for row in result.mappings():
+        if current is None or current["id"] != row["id"]:
+            if current is not None:
+                yield current
+            current = {name: row[name] for name in RECORD_FIELDS}
+            current["cursor"] = encode_cursor(row["created_at"], row["id"])
+            current["review_requests"] = []
+        if row["review_id"] is not None:
+            current["review_requests"].append({name: row[f"review_{name}"] for name in REVIEW_FIELDS})
+    if current is not None:
+        yield current
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return getattr(value, "value", value)
+
+
+def _csv_line(values: list[Any]) -> bytes:
+    buf = io.StringIO()
+    csv.writer(buf).writerow([_csv_value(v) for v in values])
+    return buf.getvalue().encode()
+
+
+def _encode(record: dict[str, Any], fmt: str) -> bytes:
+    if fmt == "ndjson":
+        return to_json(record) + b"\n"
+    head = [record[name] for name in RECORD_FIELDS]
+    reviews = record["review_requests"] or [dict.fromkeys(REVIEW_FIELDS)]
+    # Only the record's last row carries the cursor: resuming from an earlier row would skip
+    # the rest of that record's reviews.
+    cursors = [None] * (len(reviews) - 1) + [record["cursor"]]
+    return b"".join(
+        _csv_line([cursor, *head, *(rr[name] for name in REVIEW_FIELDS)]) for cursor, rr in zip(cursors, reviews)
+    )
+
+
+async def export_archive(
+    session: AsyncSession, filters: ExportFilter, fmt: str = "ndjson", gzip: bool = False
+) -> AsyncIterator[bytes]:
+    """
+    Encoded export in ~CHUNK_BYTES pieces, optionally gzip-compressed on the fly.
+    CSV has one row per review request (records without reviews get one row with empty review
+    columns) and the cursor on each record's last row; the header is skipped when resuming so the output can be appended to the first part.
+    """
+    compressor = zlib.compressobj(wbits=31) if gzip else None
+    pending: list[bytes] = [_csv_line(CSV_HEADER)] if fmt == "csv" and filters.after is None else []
+    size = sum(map(len, pending))
+
+    def drain() -> bytes:
+        data = b"".join(pending)
+        pending.clear()
+        return compressor.compress(data) if compressor else data
+
+    async for record in iter_archived_records(session, filters):
+        line = _encode(record, fmt)
+        pending.append(line)
+        size += len(line)
+        if size >= CHUNK_BYTES:
+            size = 0
+            chunk = drain()
+            if chunk:
+                yield chunk
+    tail = drain()
+    if compressor:
+        tail += compressor.flush()
+    if tail:
+        yield tail
@@ -0,0 +1,86 @@
+from collections import Counter
+from typing import Mapping
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import FeedBucketCounter, Record, RecordStatus
+
+FEED_BUCKETS: dict[str, list[RecordStatus]] = {
+    "live": [RecordStatus.live],
+    "investigating": [RecordStatus.under_review],
+    "archive": [RecordStatus.verified, RecordStatus.falsified],
+}
+_BUCKET_BY_STATUS = {status: bucket for bucket, statuses in FEED_BUCKETS.items() for status in statuses}
+
+
+def bucket_for_status(status: RecordStatus) -> str:
+    return _BUCKET_BY_STATUS[status]
+
+
+def transition_deltas(old: RecordStatus | None, new: RecordStatus) -> Counter:
+    deltas: Counter = Counter()
+    if old is not None:
+        deltas[bucket_for_status(old)] -= 1
+    deltas[bucket_for_status(new)] += 1
+    return deltas
+
+
+async def apply_bucket_deltas(session: AsyncSession, deltas: Mapping[str, int]) -> None:
+    """
+    Add deltas to the counters in the caller's transaction (no commit).
+    Rows are written in bucket order so concurrent writers lock them consistently.
+    """
+    values = [{"bucket": bucket, "record_count": delta} for bucket, delta in sorted(deltas.items()) if delta]
+    if not values:
+        return
+    stmt = insert(FeedBucketCounter).values(values)
+    await session.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[FeedBucketCounter.bucket],
+            set_={
+                "record_count": FeedBucketCounter.record_count + stmt.excluded.record_count,
+                "updated_at": func.now(),
+            },
+        )
+    )
+
+
+async def record_status_change(session: AsyncSession, old: RecordStatus | None, new: RecordStatus) -> None:
+    await apply_bucket_deltas(session, transition_deltas(old, new))
+
+
+async def load_bucket_counts(session: AsyncSession) -> dict[str, int]:
+    result = await session.execute(select(FeedBucketCounter.bucket, FeedBucketCounter.record_count))
+    counts = dict.fromkeys(FEED_BUCKETS, 0)
+    counts.update(result.all())
+    return counts
+
+
+async def repair_bucket_counters(session: AsyncSession) -> dict[str, int]:
+    """
+    Recompute every counter from records. The counter rows are locked first, so writers
+    applying deltas wait and the recount cannot race with them.
+    Returns the drift that was corrected, per bucket.
+    """
+    await session.execute(
+        insert(FeedBucketCounter)
+        .values([{"bucket": bucket, "record_count": 0} for bucket in FEED_BUCKETS])
+        .on_conflict_do_nothing()
+    )
+    locked = await session.execute(
+        select(FeedBucketCounter).order_by(FeedBucketCounter.bucket).with_for_update()
+    )
+    counters = {counter.bucket: counter for counter in locked.scalars()}
+    result = await session.execute(select(Record.status, func.count()).group_by(Record.status))
+    actual: Counter = Counter()
+    for status, count in result:
+        actual[bucket_for_status(status)] += count
+    drift = {}
+    for bucket, counter in counters.items():
+        if counter.record_count != actual[bucket]:
+            drift[bucket] = actual[bucket] - counter.record_count
+            counter.record_count = actual[bucket]
+    await session.commit()
+    return drift
@@ -0,0 +1,94 @@
+import math
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import ColumnElement, Float, Select, cast, func, select, tuple_, union_all, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import Record, RecordStatus, ReviewRequest
+
+# Time-invariant ranking: a record's score only changes when its activity does, so decay
+# needs no periodic rescoring. Every HOT_DECAY_SECONDS of age is worth a 10x larger weight.
+HOT_EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+# 12.5h: the sharpest resolution (x2.5, log10 = 0.4) keeps a report ahead of an equally
+# reviewed vague one for 5h, and a 10x review lead buys 12.5h over brand-new reports. Cases
+# collect reviews for REVIEW_REQUEST_DURATION_HOURS (72h), so even a heavily contested record
+# (~100 reviews, 25h) yields the top of the live feed to fresh reports well within its window.
+HOT_DECAY_SECONDS = 45000.0
+HOT_PAGE_SIZE = 30
+
+
+def hot_score(resolution_multiplier: float, review_count: int, created_at: datetime) -> float:
+    """
+    log10(multiplier * (1 + review requests)) + age bonus; mirrors hot_score_expr().
+    """
+    weight = max(resolution_multiplier * (1 + review_count), 1.0)
+    return math.log10(weight) + (created_at - HOT_EPOCH).total_seconds() / HOT_DECAY_SECONDS
+
+
+def hot_score_expr() -> ColumnElement[float]:
+    review_count = (
+        select(func.count())
+        .where(ReviewRequest.record_id == Record.id)
+        .correlate(Record)
+        .scalar_subquery()
+    )
+    age = cast(func.extract("epoch", Record.created_at), Float) - HOT_EPOCH.timestamp()
+    # resolution_multiplier >= 1.0, so the weight never drops below 1.
+    return func.log(Record.resolution_multiplier * (1 + review_count)) + age / HOT_DECAY_SECONDS
+
+
+def hot_feed_query(statuses: list[RecordStatus], after: tuple[float, uuid.UUID] | None, limit: int) -> Select:
+    """
+    Scored records of the given statuses by (hot_score, id) descending, after the keyset cursor.
+    A multi-status IN list cannot walk the (status, hot_score, id) index in score order, so
+    each status gets its own ordered, limited index scan and only their union is sorted.
+    """
+
+    def scan(stmt: Select) -> Select:
+        stmt = stmt.where(Record.hot_score.is_not(None))
+        if after:
+            stmt = stmt.where(tuple_(Record.hot_score, Record.id) < after)
+        return stmt.order_by(Record.hot_score.desc(), Record.id.desc()).limit(limit)
+
+    if len(statuses) == 1:
+        return scan(select(Record).where(Record.status == statuses[0]))
+    candidates = union_all(
+        *(scan(select(Record.id).where(Record.status == status)) for status in statuses)
+    ).subquery()
+    return (
+        select(Record)
+        .where(Record.id.in_(select(candidates.c.id)))
+        .order_by(Record.hot_score.desc(), Record.id.desc())
+        .limit(limit)
+    )
+
+
+async def refresh_stale_hot_scores(session: AsyncSession, batch_size: int) -> int:
+    """
+    Recompute scores of records flagged hot_score_stale, one committed batch at a time.
+    Rows locked by an in-flight review request are skipped and picked up by the next run.
+    Returns the number of records rescored.
+    """
+    refreshed = 0
+    while True:
+        batch = (
+            select(Record.id)
+            .where(Record.hot_score_stale)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        result = await session.execute(
+            update(Record)
+            .where(Record.id.in_(batch))
+            # Rescoring is bookkeeping, not an edit: keep updated_at.
+            .values(hot_score=hot_score_expr(), hot_score_stale=False, updated_at=Record.updated_at)
+            .returning(Record.id)
+            .execution_options(synchronize_session=False)
+        )
+        count = len(result.all())
+        await session.commit()
+        if not count:
+            return refreshed
+        refreshed += count
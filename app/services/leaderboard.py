@@ -0,0 +1,165 @@
+import asyncio
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+
+from sqlalchemy import Integer, Uuid, column, func, select, update, values
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import get_settings
+from ..models import Record, RecordStatus, User
+
+LEADERBOARD_SIZE = 100
+PAGE_SIZE = 25
+BOARDS = {
+    "vp": User.vp_balance,
+    "verified": User.verified_record_count,
+}
+
+
+@dataclass
+class LeaderboardEntry:
+    user_id: uuid.UUID
+    display_name: str
+    score: int
+
+    @property
+    def sort_key(self) -> tuple[int, uuid.UUID]:
+        # Same order as the (score, id) index scanned backwards: score desc, id desc.
+        return (self.score, self.user_id)
+
+
+@dataclass
+class _TopK:
+    entries: list[LeaderboardEntry] = field(default_factory=list)
+    loaded_at: float | None = None
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class Leaderboard:
+    """
+    In-process top-K per board. Writes in this process are applied incrementally via observe();
+    a reload (one index scan of K rows) happens when an entry may have dropped out of the
+    top K or after leaderboard_refresh_seconds, which also picks up other workers' writes.
+    """
+
+    def __init__(self, size: int = LEADERBOARD_SIZE):
+        self.size = size
+        self._boards = {board: _TopK() for board in BOARDS}
+
+    def observe(self, board: str, user_id: uuid.UUID, display_name: str, score: int) -> None:
+        top = self._boards[board]
+        if top.loaded_at is None:
+            return
+        entries = [e for e in top.entries if e.user_id != user_id]
+        was_ranked = len(entries) != len(top.entries)
+        entry = LeaderboardEntry(user_id, display_name, score)
+        full = len(top.entries) >= self.size
+        floor = top.entries[-1].sort_key if top.entries else None
+        if full and floor is not None and entry.sort_key < floor:
+            if was_ranked:
+                # Fell below the old K-th entry; whoever replaces it is unknown here.
+                top.loaded_at = None
+            return
+        entries.append(entry)
+        entries.sort(key=lambda e: e.sort_key, reverse=True)
+        top.entries = entries[: self.size]
+
+    def invalidate(self, board: str | None = None) -> None:
+        for name in [board] if board else list(self._boards):
+            self._boards[name].loaded_at = None
+
+    async def _ensure_loaded(self, session: AsyncSession, board: str) -> _TopK:
+        top = self._boards[board]
+        ttl = get_settings().leaderboard_refresh_seconds
+        if top.loaded_at is not None and time.monotonic() - top.loaded_at < ttl:
+            return top
+        async with top.lock:
+            if top.loaded_at is not None and time.monotonic() - top.loaded_at < ttl:
+                return top
+            column = BOARDS[board]
+            result = await session.execute(
+                select(User.id, User.display_name, column)
+                .order_by(column.desc(), User.id.desc())
+                .limit(self.size)
+            )
+            top.entries = [LeaderboardEntry(*row) for row in result]
+            top.loaded_at = time.monotonic()
+        return top
+
+    async def page(
+        self, session: AsyncSession, board: str, page: int
+    ) -> tuple[list[LeaderboardEntry], bool]:
+        """
+        One page of the top-K and whether another page follows; pages past K are empty by design.
+        """
+        top = await self._ensure_loaded(session, board)
+        start = (page - 1) * PAGE_SIZE
+        return top.entries[start : start + PAGE_SIZE], len(top.entries) > start + PAGE_SIZE
+
+
+leaderboard = Leaderboard()
+
+
+async def apply_verified_count_deltas(session: AsyncSession, deltas: Counter) -> list[tuple]:
+    """
+    Bump users.verified_record_count for all authors in one UPDATE ... FROM (VALUES ...).
+    The author rows are locked in id order first: the UPDATE's join order is up to the planner,
+    and two finalizers locking overlapping authors in different orders would deadlock.
+    Returns (user_id, display_name, new count) for the leaderboard.
+    """
+    rows = [(user_id, delta) for user_id, delta in deltas.items() if delta]
+    if not rows:
+        return []
+    await session.execute(
+        select(User.id).where(User.id.in_([user_id for user_id, _ in rows])).order_by(User.id).with_for_update()
+    )
+    changes = values(column("user_id", Uuid), column("delta", Integer), name="verified_deltas").data(rows)
+    result = await session.execute(
+        update(User)
+        .where(User.id == changes.c.user_id)
+        .values(verified_record_count=User.verified_record_count + changes.c.delta)
+        .returning(User.id, User.display_name, User.verified_record_count)
+        .execution_options(synchronize_session=False)
+    )
+    return result.all()
+
+
+async def repair_verified_counts(session: AsyncSession, batch_size: int = 1000) -> dict:
+    """
+    Recompute users.verified_record_count from records, one batch of users at a time.
+    Each batch's user rows are locked before counting, so a concurrent finalizer either
+    committed before the count or waits and applies its delta on top of the repaired value.
+    Returns {user_id: corrected drift}.
+    """
+    drift = {}
+    after = None
+    while True:
+        locked = (
+            select(User)
+            .order_by(User.id)
+            .limit(batch_size)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        if after is not None:
+            locked = locked.where(User.id > after)
+        users = (await session.execute(locked)).scalars().all()
+        if not users:
+            return drift
+        after = users[-1].id
+        result = await session.execute(
+            select(Record.created_by, func.count())
+            .where(Record.created_by.in_([user.id for user in users]))
+            .where(Record.status == RecordStatus.verified)
+            .group_by(Record.created_by)
+        )
+        actual = dict(result.all())
+        for user in users:
+            count = actual.get(user.id, 0)
+            if user.verified_record_count != count:
+                drift[user.id] = count - user.verified_record_count
+                user.verified_record_count = count
+        await session.commit()
+        session.expunge_all()
@@ -0,0 +1,176 @@
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import get_settings
+from ..models import JobCheckpoint, User, VerificationPoint, VerificationPointSnapshot
+
+ROLLUP_CHECKPOINT = "vp_ledger_rollup"
+
+
+@dataclass
+class BalanceMismatch:
+    user_id: uuid.UUID
+    vp_balance: int
+    expected: int
+
+
+async def rollup_vp_ledger(
+    session: AsyncSession,
+    now: datetime | None = None,
+    batch_size: int | None = None,
+) -> int:
+    """
+    Fold new VerificationPoint rows into vp_ledger_snapshots, one seq range per commit.
+    Rows younger than the settle window are left for the next run so that a slow
+    in-flight transaction holding a lower seq is not skipped by the high-water mark.
+    A writer that commits later than the window is still skipped; reconcile_vp detects
+    that and repair_vp_snapshots() folds such rows in.
+    Returns the number of ledger rows rolled up.
+    """
+    settings = get_settings()
+    now = now or datetime.now(timezone.utc)
+    batch_size = batch_size or settings.vp_rollup_batch_size
+    cutoff = now - timedelta(seconds=settings.vp_rollup_settle_seconds)
+    rolled = 0
+    while True:
+        # Overlapping first runs must not both try to create the row; the lock then serializes them.
+        await session.execute(
+            insert(JobCheckpoint).values(name=ROLLUP_CHECKPOINT, position=0).on_conflict_do_nothing()
+        )
+        checkpoint = await session.get(
+            JobCheckpoint, ROLLUP_CHECKPOINT, with_for_update=True, populate_existing=True
+        )
+        watermark = checkpoint.position
+        bounds = await session.execute(
+            select(
+                func.max(VerificationPoint.seq),
+                select(func.min(VerificationPoint.seq))
+                .where(VerificationPoint.seq > watermark)
+                .where(VerificationPoint.created_at > cutoff)
+                .scalar_subquery(),
+            ).where(VerificationPoint.seq > watermark)
+        )
+        max_seq, unsettled_seq = bounds.one()
+        if max_seq is None:
+            break
+        chunk_end = min(watermark + batch_size, max_seq)
+        if unsettled_seq is not None:
+            chunk_end = min(chunk_end, unsettled_seq - 1)
+        if chunk_end <= watermark:
+            break
+        totals = await session.execute(
+            select(
+                VerificationPoint.user_id,
+                func.sum(VerificationPoint.delta),
+                func.count(),
+                func.max(VerificationPoint.seq),
+            )
+            .where(VerificationPoint.seq > watermark)
+            .where(VerificationPoint.seq <= chunk_end)
+            .group_by(VerificationPoint.user_id)
+        )
+        rows = [
+            {"user_id": user_id, "delta_total": total, "entry_count": count, "last_seq": last_seq}
+            for user_id, total, count, last_seq in totals
+        ]
+        if rows:
+            stmt = insert(VerificationPointSnapshot).values(rows)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[VerificationPointSnapshot.user_id],
+                set_={
+                    "delta_total": VerificationPointSnapshot.delta_total + stmt.excluded.delta_total,
+                    "entry_count": VerificationPointSnapshot.entry_count + stmt.excluded.entry_count,
+                    "last_seq": stmt.excluded.last_seq,
+                    "updated_at": func.now(),
+                },
+            )
+            await session.execute(stmt)
+            rolled += sum(row["entry_count"] for row in rows)
+        checkpoint.position = chunk_end
+        await session.commit()
+    await session.commit()
+    return rolled
+
+
+async def reconcile_vp_balances(
+    session: AsyncSession, batch_size: int | None = None
+) -> AsyncIterator[tuple[int, list[BalanceMismatch]]]:
+    """
+    Compare users.vp_balance with initial VP + snapshot total + ledger tail,
+    walking users in id order. Yields (users checked, mismatches) per batch.
+    Each batch is a single statement, so snapshot and tail are read consistently
+    even while the rollup job is running.
+    """
+    settings = get_settings()
+    batch_size = batch_size or settings.vp_reconcile_batch_size
+    after: uuid.UUID | None = None
+    while True:
+        users = select(User.id, User.vp_balance).order_by(User.id).limit(batch_size)
+        if after is not None:
+            users = users.where(User.id > after)
+        users = users.cte("batch_users")
+        snapshot_total = func.coalesce(VerificationPointSnapshot.delta_total, 0)
+        tail_total = (
+            select(func.coalesce(func.sum(VerificationPoint.delta), 0))
+            .where(VerificationPoint.user_id == users.c.id)
+            .where(VerificationPoint.seq > func.coalesce(VerificationPointSnapshot.last_seq, 0))
+            .correlate(users, VerificationPointSnapshot)
+            .scalar_subquery()
+        )
+        result = await session.execute(
+            select(users.c.id, users.c.vp_balance, snapshot_total + tail_total)
+            .outerjoin(VerificationPointSnapshot, VerificationPointSnapshot.user_id == users.c.id)
+            .order_by(users.c.id)
+        )
+        rows = result.all()
+        if not rows:
+            break
+        mismatches = [
+            BalanceMismatch(user_id=user_id, vp_balance=balance, expected=settings.initial_vp + ledger)
+            for user_id, balance, ledger in rows
+            if balance != settings.initial_vp + ledger
+        ]
+        yield len(rows), mismatches
+        after = rows[-1][0]
+        # Release the read snapshot between batches.
+        await session.commit()
+
+
+async def repair_vp_snapshots(session: AsyncSession, user_ids: list[uuid.UUID]) -> int:
+    """
+    Recompute the given users' snapshots from every ledger row up to their last_seq,
+    which folds in rows that committed after the rollup had passed their seq.
+    The snapshot rows are locked first so a concurrent rollup waits. Returns the number changed.
+    """
+    if not user_ids:
+        return 0
+    locked = await session.execute(
+        select(VerificationPointSnapshot)
+        .where(VerificationPointSnapshot.user_id.in_(user_ids))
+        .order_by(VerificationPointSnapshot.user_id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+    snapshots = {snapshot.user_id: snapshot for snapshot in locked.scalars()}
+    totals = await session.execute(
+        select(VerificationPoint.user_id, func.sum(VerificationPoint.delta), func.count())
+        .join(VerificationPointSnapshot, VerificationPointSnapshot.user_id == VerificationPoint.user_id)
+        .where(VerificationPoint.user_id.in_(list(snapshots)))
+        .where(VerificationPoint.seq <= VerificationPointSnapshot.last_seq)
+        .group_by(VerificationPoint.user_id)
+    )
+    changed = 0
+    for user_id, total, count in totals:
+        snapshot = snapshots[user_id]
+        if (snapshot.delta_total, snapshot.entry_count) != (total, count):
+            snapshot.delta_total = total
+            snapshot.entry_count = count
+            changed += 1
+    await session.commit()
+    return changed
@@ -0,0 +1,31 @@
+import time
+from collections import deque
+
+
+class SlidingWindowLimiter:
+    """
+    In-process limit of `limit` hits per `window_seconds` for each key. Every worker keeps its
+    own window, so the effective limit is per worker; that is enough to stop one client from
+    monopolising a worker with long streams.
+    """
+
+    def __init__(self, limit: int, window_seconds: float):
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self._hits: dict[str, deque[float]] = {}
+
+    def hit(self, key: str, now: float | None = None) -> float | None:
+        """
+        Record a hit for key. Returns None when allowed, otherwise the seconds until a slot frees up.
+        """
+        now = time.monotonic() if now is None else now
+        hits = self._hits.setdefault(key, deque())
+        while hits and hits[0] <= now - self.window_seconds:
+            hits.popleft()
+        if len(hits) >= self.limit:
+            return hits[0] + self.window_seconds - now
+        hits.append(now)
+        return None
+
+    def reset(self) -> None:
+        self._hits.clear()
@@ -1,25 +1,36 @@
+from collections import Counter
 from datetime import datetime, timezone
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
 from ..models import RecordStatus, ReviewRequest, ReviewRequestStatus, ReviewVerdict
+from .feed_counters import apply_bucket_deltas, transition_deltas
+from .leaderboard import apply_verified_count_deltas, leaderboard
+from .snapshots import FINAL_STATUSES, schedule_case_snapshots
 
 
 async def finalize_expired_reviews(session: AsyncSession, now: datetime | None = None) -> int:
     """
     Batch finalize review requests that reached expires_at.
     Returns the number of finalized requests.
+    The requests and their records are locked, skipping rows another transaction holds, so
+    concurrent page views never turn the same request or record transition into deltas twice.
     """
     now = now or datetime.now(timezone.utc)
     result = await session.execute(
         select(ReviewRequest)
+        .options(joinedload(ReviewRequest.record, innerjoin=True))
         .where(ReviewRequest.status == ReviewRequestStatus.open)
         .where(ReviewRequest.expires_at <= now)
         .order_by(ReviewRequest.expires_at)
+        .with_for_update(skip_locked=True)
     )
     requests = result.scalars().all()
     finalized = 0
+    touched = {}
     for rr in requests:
+        touched.setdefault(rr.record.id, (rr.record, rr.record.status))
         verdict = ReviewVerdict.falsified if rr.is_counter_evidence else ReviewVerdict.verified
         rr.status = ReviewRequestStatus.finalized
         rr.verdict = verdict
@@ -30,5 +41,20 @@ async def finalize_expired_reviews(session: AsyncSession, now: datetime | None =
             rr.record.status = RecordStatus.verified
         finalized += 1
     if finalized:
+        deltas = Counter()
+        verified_deltas = Counter()
+        for record, old_status in touched.values():
+            deltas.update(transition_deltas(old_status, record.status))
+            if record.created_by:
+                verified_deltas[record.created_by] += (record.status == RecordStatus.verified) - (
+                    old_status == RecordStatus.verified
+                )
+        await apply_bucket_deltas(session, deltas)
+        ranked = await apply_verified_count_deltas(session, verified_deltas)
         await session.commit()
+        for user_id, display_name, count in ranked:
+            leaderboard.observe("verified", user_id, display_name, count)
+        schedule_case_snapshots(
+            record.id for record, _ in touched.values() if record.status in FINAL_STATUSES
+        )
     return finalized
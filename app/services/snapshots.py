@@ -0,0 +1,180 @@
+import asyncio
+import contextvars
+import logging
+import os
+import tempfile
+import uuid
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Iterable
+
+from fastapi import Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, Response
+from fastapi.templating import Jinja2Templates
+from sqlalchemy import exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from ..config import get_settings
+from ..database import AsyncSessionLocal
+from ..models import Record, RecordStatus, ReviewRequest, ReviewRequestStatus
+from ..pagination import REVIEWS_PAGE_SIZE, encode_cursor
+from .analysis import simple_5w1h
+
+logger = logging.getLogger("truburn.snapshots")
+templates = Jinja2Templates(directory="app/templates")
+
+FINAL_STATUSES = (RecordStatus.verified, RecordStatus.falsified)
+SNAPSHOT_CACHE_CONTROL = "public, max-age=300"
+
+_pending: set[asyncio.Task] = set()
+
+
+def snapshot_path(record_id: uuid.UUID) -> Path:
+    # Two-level fan-out keeps directories small with many cases.
+    name = str(record_id)
+    return Path(get_settings().snapshot_dir) / name[:2] / f"{name}.html"
+
+
+async def render_case_snapshot(session: AsyncSession, record_id: uuid.UUID) -> str | None:
+    """
+    Render records/detail.html for a finalized record as an anonymous visitor sees it, with
+    the first page of review requests; older pages link to the dynamic route. Returns None
+    unless the record is finalized and has no open review request left (a later
+    counter-evidence verdict could still flip it).
+    Link checks and possible duplicates keep changing, so the page loads them via HTMX.
+    """
+    result = await session.execute(
+        select(Record).options(joinedload(Record.author)).where(Record.id == record_id)
+    )
+    record = result.scalar_one_or_none()
+    if not record or record.status not in FINAL_STATUSES:
+        return None
+    has_open = await session.scalar(
+        select(
+            exists().where(
+                ReviewRequest.record_id == record.id, ReviewRequest.status == ReviewRequestStatus.open
+            )
+        )
+    )
+    if has_open:
+        return None
+    rr_result = await session.execute(
+        select(ReviewRequest)
+        .options(joinedload(ReviewRequest.requester))
+        .where(ReviewRequest.record_id == record.id)
+        .order_by(ReviewRequest.created_at.desc(), ReviewRequest.id.desc())
+        .limit(REVIEWS_PAGE_SIZE + 1)
+    )
+    review_requests = rr_result.scalars().all()
+    next_reviews_cursor = None
+    if len(review_requests) > REVIEWS_PAGE_SIZE:
+        review_requests = review_requests[:REVIEWS_PAGE_SIZE]
+        next_reviews_cursor = encode_cursor(review_requests[-1].created_at, review_requests[-1].id)
+    return templates.get_template("records/detail.html").render(
+        {
+            "record": record,
+            "analysis": simple_5w1h(record.body),
+            "review_requests": review_requests,
+            "reviews_before": None,
+            "next_reviews_cursor": next_reviews_cursor,
+            "deferred_panels": True,
+            "default_resolution_hours": get_settings().review_request_duration_hours,
+            "current_user": None,
+        }
+    )
+
+
+async def snapshot_response(request: Request, path: Path) -> Response | None:
+    """
+    Serve a snapshot with ETag/Last-Modified validators, answering conditional requests with 304.
+    A re-render (e.g. backfill --force) changes both, so caches pick it up within max-age.
+    Returns None when there is no snapshot; the stat runs in the threadpool, off the event loop.
+    """
+    try:
+        stat = await run_in_threadpool(path.stat)
+    except FileNotFoundError:
+        return None
+    headers = {
+        "Cache-Control": SNAPSHOT_CACHE_CONTROL,
+        # Snapshots are only served to anonymous sessions.
+        "Vary": "Cookie",
+        "ETag": f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"',
+        "Last-Modified": formatdate(stat.st_mtime, usegmt=True),
+    }
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        not_modified = headers["ETag"] in [tag.strip() for tag in if_none_match.split(",")]
+    else:
+        not_modified = _not_modified_since(request.headers.get("if-modified-since"), stat.st_mtime)
+    if not_modified:
+        return Response(status_code=304, headers=headers)
+    return FileResponse(path, media_type="text/html", stat_result=stat, headers=headers)
+
+
+def _not_modified_since(header: str | None, mtime: float) -> bool:
+    if not header:
+        return False
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    return int(mtime) <= since.timestamp()
+
+
+def _write_atomic(path: Path, html: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(html)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+async def write_case_snapshots(
+    session: AsyncSession, record_ids: Iterable[uuid.UUID], overwrite: bool = True
+) -> int:
+    """
+    Render and atomically write snapshots for finalized records. Returns the number written.
+    """
+    written = 0
+    for record_id in record_ids:
+        path = snapshot_path(record_id)
+        if not overwrite and path.exists():
+            continue
+        html = await render_case_snapshot(session, record_id)
+        if html is None:
+            continue
+        _write_atomic(path, html)
+        written += 1
+    return written
+
+
+async def _write_in_background(record_ids: list[uuid.UUID]) -> None:
+    try:
+        async with AsyncSessionLocal() as session:
+            await write_case_snapshots(session, record_ids)
+    except Exception:
+        logger.exception("Failed to write case snapshots for %s", record_ids)
+
+
+def schedule_case_snapshots(record_ids: Iterable[uuid.UUID]) -> None:
+    """
+    Write snapshots off the caller's request. The task gets a fresh context so its queries
+    are not attributed to the request that triggered finalization.
+    """
+    record_ids = list(record_ids)
+    if not record_ids:
+        return
+    task = asyncio.create_task(_write_in_background(record_ids), context=contextvars.Context())
+    _pending.add(task)
+    task.add_done_callback(_pending.discard)
+
+
+async def wait_for_pending_snapshots() -> None:
+    while _pending:
+        await asyncio.gather(*_pending)
@@ -0,0 +1,97 @@
+"""
+Compare throughput of the JSON API with the equivalent HTML pages.
+
+    python benchmarks/api_vs_html.py --base-url http://localhost:8000 --requests 500 --concurrency 20
+    python benchmarks/api_vs_html.py --serializers   # in-process, no server/DB needed
+
+The HTTP mode needs a running server with some records in the DB.
+"""
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+async def _hammer(client: httpx.AsyncClient, path: str, total: int, concurrency: int) -> float:
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        async with sem:
+            resp = await client.get(path)
+            resp.raise_for_status()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    return total / (time.perf_counter() - started)
+
+
+async def run_http(base_url: str, total: int, concurrency: int) -> None:
+    async with httpx.AsyncClient(base_url=base_url, timeout=30) as client:
+        listing = (await client.get("/api/records", params={"limit": 1})).json()
+        pairs = [("/feed/live", "/api/records?status=live&limit=50")]
+        if listing["items"]:
+            record_id = listing["items"][0]["id"]
+            pairs.append((f"/case/{record_id}", f"/api/records/{record_id}"))
+        for html_path, api_path in pairs:
+            html_rps = await _hammer(client, html_path, total, concurrency)
+            api_rps = await _hammer(client, api_path, total, concurrency)
+            print(f"{html_path:<50} {html_rps:8.1f} req/s")
+            print(f"{api_path:<50} {api_rps:8.1f} req/s  ({api_rps / html_rps:.1f}x)")
+
+
+def run_serializers(rows: int) -> None:
+    from pydantic_core import to_json
+
+    from app.models import RecordStatus
+    from app.schemas import RecordRead
+
+    now = datetime.now(timezone.utc)
+    data = [
+        {
+            "id": uuid.uuid4(),
+            "title": f"record {i}",
+            "body": "x" * 400,
+            "evidence_url": "https://example.com/evidence",
+            "time_occurred_start": now - timedelta(hours=2),
+            "time_occurred_end": now,
+            "resolution_level": 4,
+            "resolution_multiplier": 2.1,
+            "status": RecordStatus.live,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for i in range(rows)
+    ]
+
+    started = time.perf_counter()
+    validated = b"[" + b",".join(RecordRead.model_validate(d).model_dump_json().encode() for d in data) + b"]"
+    pydantic_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    fast = to_json(data)
+    fast_s = time.perf_counter() - started
+
+    assert len(validated) and len(fast)
+    print(f"pydantic validate+dump: {rows / pydantic_s:10.0f} rows/s")
+    print(f"pydantic-core to_json:  {rows / fast_s:10.0f} rows/s  ({pydantic_s / fast_s:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--serializers", action="store_true", help="only compare serializers in-process")
+    parser.add_argument("--rows", type=int, default=50000)
+    args = parser.parse_args()
+    if args.serializers:
+        run_serializers(args.rows)
+    else:
+        asyncio.run(run_http(args.base_url, args.requests, args.concurrency))
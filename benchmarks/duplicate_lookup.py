@@ -0,0 +1,78 @@
+"""
+Near-duplicate lookup latency against corpus size: LSH bucket lookup vs brute-force MinHash scan.
+
+    python benchmarks/duplicate_lookup.py --sizes 1000 4000 16000 --queries 200
+
+Runs in-process on synthetic text with the same signature/banding code as the app.
+The in-memory bucket dict stands in for the (band, bucket) primary-key index on
+record_lsh_buckets, so the per-lookup work is the same: one probe per band plus
+scoring the candidates.
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.services.duplicates import (  # noqa: E402
+    DEFAULT_THRESHOLD,
+    band_keys,
+    estimate_similarity,
+    minhash_signature,
+)
+
+WORDS = [f"w{i}" for i in range(5000)]
+
+
+def make_text(rng: random.Random) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(40))
+
+
+def mutate(text: str, rng: random.Random) -> str:
+    words = text.split()
+    for _ in range(3):
+        words[rng.randrange(len(words))] = rng.choice(WORDS)
+    return " ".join(words)
+
+
+def bench(size: int, queries: int, rng: random.Random) -> None:
+    texts = [make_text(rng) for _ in range(size)]
+    signatures = [minhash_signature("", t) for t in texts]
+    buckets: defaultdict[tuple[int, int], list[int]] = defaultdict(list)
+    for idx, sig in enumerate(signatures):
+        for key in band_keys(sig):
+            buckets[key].append(idx)
+
+    probes = [minhash_signature("", mutate(texts[rng.randrange(size)], rng)) for _ in range(queries)]
+
+    lsh_times, scan_times, found = [], [], 0
+    for sig in probes:
+        started = time.perf_counter()
+        candidates = {idx for key in band_keys(sig) for idx in buckets.get(key, ())}
+        hits = [i for i in candidates if estimate_similarity(sig, signatures[i]) >= DEFAULT_THRESHOLD]
+        lsh_times.append(time.perf_counter() - started)
+        found += bool(hits)
+
+        started = time.perf_counter()
+        [i for i, other in enumerate(signatures) if estimate_similarity(sig, other) >= DEFAULT_THRESHOLD]
+        scan_times.append(time.perf_counter() - started)
+
+    print(
+        f"corpus={size:>7}  lsh p50={statistics.median(lsh_times) * 1e3:7.3f}ms"
+        f"  scan p50={statistics.median(scan_times) * 1e3:8.3f}ms"
+        f"  recall={found / queries:.2f}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 4000, 16000])
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+    rng = random.Random(0)
+    for size in args.sizes:
+        bench(size, args.queries, rng)
@@ -0,0 +1,89 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.models import RecordStatus
+from app.pagination import REVIEWS_PAGE_SIZE
+
+from .conftest import make_record, make_review_request, make_user
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_list_records_keyset_pagination(client, session):
+    author = await make_user(session)
+    created = [await make_record(session, author, title=f"record {i}") for i in range(5)]
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        page = (await client.get("/api/records", params=params)).json()
+        seen += [item["title"] for item in page["items"]]
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+    assert seen == [r.title for r in reversed(created)]
+
+
+async def test_list_records_rejects_bad_cursor(client, session):
+    resp = await client.get("/api/records", params={"cursor": "not-a-cursor"})
+    assert resp.status_code == 400
+
+
+async def test_list_records_filters(client, session):
+    author = await make_user(session)
+    now = datetime.now(timezone.utc)
+    live = await make_record(session, author, title="live")
+    archived = await make_record(session, author, title="archived", status=RecordStatus.verified)
+    archived.time_occurred_start = now - timedelta(days=10)
+    archived.time_occurred_end = now - timedelta(days=9)
+    await session.commit()
+
+    def titles(resp):
+        return {item["title"] for item in resp.json()["items"]}
+
+    assert titles(await client.get("/api/records", params={"status": "live"})) == {live.title}
+    both = await client.get("/api/records", params=[("status", "live"), ("status", "verified")])
+    assert titles(both) == {live.title, archived.title}
+    recent = {"occurred_from": (now - timedelta(days=1)).isoformat()}
+    assert titles(await client.get("/api/records", params=recent)) == {live.title}
+    old = {"occurred_to": (now - timedelta(days=5)).isoformat()}
+    assert titles(await client.get("/api/records", params=old)) == {archived.title}
+
+
+async def test_batch_get_keeps_request_order_and_reports_missing(client, session):
+    author = await make_user(session)
+    a = await make_record(session, author, title="a")
+    b = await make_record(session, author, title="b")
+    missing = uuid.uuid4()
+    ids = [str(b.id), str(missing), str(a.id), str(b.id)]
+    resp = await client.get("/api/records:batchGet", params=[("ids", i) for i in ids])
+    assert resp.status_code == 200
+    body = resp.json()
+    assert [r["title"] for r in body["records"]] == ["b", "a"]
+    assert body["missing"] == [str(missing)]
+
+
+async def test_batch_get_limit(client, session):
+    ids = [("ids", str(uuid.uuid4())) for _ in range(101)]
+    assert (await client.get("/api/records:batchGet", params=ids)).status_code == 400
+
+
+async def test_record_detail_pages_review_requests(client, session):
+    author = await make_user(session)
+    record = await make_record(session, author)
+    for _ in range(REVIEWS_PAGE_SIZE + 3):
+        await make_review_request(session, record, author)
+    first = (await client.get(f"/api/records/{record.id}")).json()
+    assert len(first["review_requests"]) == REVIEWS_PAGE_SIZE
+    second = (
+        await client.get(f"/api/records/{record.id}", params={"reviews_before": first["next_reviews_cursor"]})
+    ).json()
+    assert len(second["review_requests"]) == 3
+    assert second["next_reviews_cursor"] is None
+    ids = [rr["id"] for rr in first["review_requests"] + second["review_requests"]]
+    assert len(set(ids)) == REVIEWS_PAGE_SIZE + 3
+
+
+async def test_record_detail_not_found(client, session):
+    assert (await client.get(f"/api/records/{uuid.uuid4()}")).status_code == 404
@@ -0,0 +1,49 @@
+import pytest
+
+from app.services import duplicates
+from app.services.duplicates import SIGNATURE_MAX_CHARS, index_records, minhash_signature
+
+from .conftest import login, make_record, make_user
+
+pytestmark = pytest.mark.anyio
+
+BODY = "Streetlights went dark around the station for about an hour after a loud bang. " * 3
+
+
+def test_signature_only_hashes_the_head():
+    head = "a b c d e f g " * (SIGNATURE_MAX_CHARS // 7)
+    assert minhash_signature("t", head) == minhash_signature("t", head + "zzzz" * 100_000)
+
+
+async def test_case_page_reuses_stored_signature(client, session, monkeypatch):
+    author = await make_user(session)
+    original = await make_record(session, author, title="Blackout at the station", body=BODY)
+    copy = await make_record(session, author, title="Blackout at the station!", body=BODY)
+    await index_records(session, [original, copy])
+    await session.commit()
+
+    def fail(*args):
+        raise AssertionError("signature recomputed")
+
+    monkeypatch.setattr(duplicates, "minhash_signature", fail)
+    resp = await client.get(f"/case/{copy.id}")
+    assert resp.status_code == 200
+    assert f"/case/{original.id}" in resp.text
+
+
+async def test_duplicate_check_requires_login(client, session):
+    resp = await client.post("/records/duplicate-check", data={"title": "Blackout", "body": BODY})
+    assert resp.status_code == 401
+
+
+async def test_duplicate_check(client, session):
+    author = await make_user(session)
+    original = await make_record(session, author, title="Blackout at the station", body=BODY)
+    await index_records(session, [original])
+    await session.commit()
+    await login(client, session)
+    resp = await client.post(
+        "/records/duplicate-check", data={"title": "Blackout at the station", "body": BODY + "x" * 200_000}
+    )
+    assert resp.status_code == 200
+    assert f"/case/{original.id}" in resp.text
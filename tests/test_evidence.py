@@ -0,0 +1,216 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from sqlalchemy import select
+
+from app.config import get_settings
+from app.models import EvidenceLinkCheck
+from app.services import evidence
+from app.services.evidence import (
+    RECHECK_OK,
+    RETRY_BASE,
+    RETRY_MAX,
+    LinkResult,
+    _apply_result,
+    check_due_links,
+    check_url,
+    check_urls,
+    make_client,
+    register_evidence_urls,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status: int, headers: dict[str, str] | None = None) -> None:
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_HEAD(self):
+        if self.path == "/no-head":
+            self._reply(405)
+        else:
+            self.do_GET()
+
+    def do_GET(self):
+        if self.path == "/ok" or self.path == "/no-head":
+            self._reply(200)
+        elif self.path == "/host":
+            self._reply(200 if self.headers["Host"].startswith("evidence.example:") else 400)
+        elif self.path == "/redirect":
+            self._reply(302, {"Location": "/ok"})
+        elif self.path == "/slow":
+            time.sleep(1)
+            self._reply(200)
+        elif self.path.startswith("/held"):
+            cls = type(self)
+            with cls.lock:
+                cls.active += 1
+                cls.max_active = max(cls.max_active, cls.active)
+            time.sleep(0.2)
+            with cls.lock:
+                cls.active -= 1
+            self._reply(200)
+        else:
+            self._reply(404)
+
+
+@pytest.fixture(scope="module")
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def checker_settings(monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "evidence_check_allow_private", True)
+    monkeypatch.setattr(settings, "evidence_check_timeout_seconds", 0.3)
+    monkeypatch.setattr(settings, "evidence_check_per_host", 2)
+    monkeypatch.setattr(settings, "evidence_check_concurrency", 20)
+    return settings
+
+
+async def test_ok(stub_server, checker_settings):
+    async with make_client() as client:
+        result = await check_url(client, f"{stub_server}/ok")
+    assert result == LinkResult(status_code=200, final_url=f"{stub_server}/ok")
+
+
+async def test_redirect_records_final_url(stub_server, checker_settings):
+    async with make_client() as client:
+        result = await check_url(client, f"{stub_server}/redirect")
+    assert result.status_code == 200
+    assert result.final_url == f"{stub_server}/ok"
+
+
+async def test_not_found(stub_server, checker_settings):
+    async with make_client() as client:
+        result = await check_url(client, f"{stub_server}/missing")
+    assert result.status_code == 404
+    assert result.error is None
+
+
+async def test_head_405_falls_back_to_get(stub_server, checker_settings):
+    async with make_client() as client:
+        result = await check_url(client, f"{stub_server}/no-head")
+    assert result.status_code == 200
+
+
+async def test_timeout(stub_server, checker_settings):
+    async with make_client() as client:
+        result = await check_url(client, f"{stub_server}/slow")
+    assert result.status_code is None
+    assert result.error
+
+
+async def test_private_hosts_refused_by_default(stub_server, checker_settings):
+    checker_settings.evidence_check_allow_private = False
+    async with make_client() as client:
+        result = await check_url(client, f"{stub_server}/ok")
+    assert result.status_code is None
+    assert "non-public" in result.error
+
+
+async def test_connection_is_pinned_to_the_checked_address(stub_server, checker_settings, monkeypatch):
+    checker_settings.evidence_check_allow_private = False
+    port = stub_server.rsplit(":", 1)[1]
+    answers = {"evidence.example": ["127.0.0.1"]}
+    resolved = []
+
+    async def resolve(host, port):
+        resolved.append(host)
+        return answers[host]
+
+    monkeypatch.setattr(evidence, "_resolve", resolve)
+    # Pretend the stub server's address is public: the name is never resolved by anyone else.
+    monkeypatch.setattr(evidence, "_is_public", lambda address: True)
+    async with make_client() as client:
+        result = await check_url(client, f"http://evidence.example:{port}/host")
+    assert result.status_code == 200
+    assert resolved == ["evidence.example"]
+
+
+async def test_mixed_public_and_private_answers_are_refused(checker_settings, monkeypatch):
+    checker_settings.evidence_check_allow_private = False
+
+    async def resolve(host, port):
+        return ["93.184.216.34", "10.0.0.5"]
+
+    monkeypatch.setattr(evidence, "_resolve", resolve)
+    async with make_client() as client:
+        result = await check_url(client, "https://evidence.example/")
+    assert result.status_code is None
+    assert "non-public" in result.error
+
+
+async def test_per_host_limit(stub_server, checker_settings):
+    StubHandler.max_active = 0
+    async with make_client() as client:
+        results = await check_urls(client, [f"{stub_server}/held/{i}" for i in range(6)])
+    assert [r.status_code for r in results] == [200] * 6
+    assert StubHandler.max_active == checker_settings.evidence_check_per_host
+
+
+def test_backoff_schedule():
+    now = datetime(2026, 10, 19, tzinfo=timezone.utc)
+    check = EvidenceLinkCheck(url="https://example.com", failure_count=0)
+    delays = []
+    for _ in range(10):
+        _apply_result(check, LinkResult(status_code=404), now)
+        delays.append(check.next_check_at - now)
+    assert delays[:4] == [RETRY_BASE, RETRY_BASE * 2, RETRY_BASE * 4, RETRY_BASE * 8]
+    assert delays[-1] == RETRY_MAX
+    assert check.failure_count == 10
+
+    _apply_result(check, LinkResult(status_code=200, final_url="https://example.com"), now)
+    assert check.failure_count == 0
+    assert check.next_check_at == now + RECHECK_OK
+    assert check.checked_at == now
+
+
+async def test_check_due_links_runs_http_outside_a_transaction(
+    session, stub_server, checker_settings, monkeypatch
+):
+    urls = [f"{stub_server}/ok", f"{stub_server}/redirect", f"{stub_server}/missing"]
+    await register_evidence_urls(session, urls)
+    await session.commit()
+    in_transaction = []
+
+    async def spy(client, url):
+        in_transaction.append(session.in_transaction())
+        return await check_url(client, url)
+
+    monkeypatch.setattr(evidence, "check_url", spy)
+    now = datetime.now(timezone.utc) + timedelta(seconds=1)
+    async with make_client() as client:
+        assert await check_due_links(session, client, now=now) == 3
+    assert in_transaction == [False, False, False]
+
+    session.expunge_all()
+    result = await session.execute(select(EvidenceLinkCheck))
+    checks = {check.url: check for check in result.scalars()}
+    assert checks[urls[0]].status_code == 200
+    assert checks[urls[1]].final_url == f"{stub_server}/ok"
+    assert checks[urls[2]].status_code == 404
+    assert checks[urls[2]].next_check_at == now + RETRY_BASE
+    assert checks[urls[0]].next_check_at == now + RECHECK_OK
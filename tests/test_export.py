@@ -0,0 +1,121 @@
+import csv
+import gzip
+import io
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.config import get_settings
+from app.models import RecordStatus
+from app.routes.api import export_limiter
+
+from .conftest import login, make_record, make_review_request, make_user
+
+pytestmark = pytest.mark.anyio
+
+DAY = timedelta(days=1)
+
+
+@pytest.fixture(autouse=True)
+def fresh_limiter():
+    export_limiter.reset()
+    yield
+    export_limiter.reset()
+
+
+async def seed_archive(session):
+    """
+    Three archived records, oldest first; the middle one has two review requests.
+    A live record must never be exported.
+    """
+    author = await make_user(session)
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    records = [
+        await make_record(session, author, status=RecordStatus.verified, title=f"archived {i}", created_at=base + i * DAY)
+        for i in range(3)
+    ]
+    for _ in range(2):
+        await make_review_request(session, records[1], author)
+    records[1].status = RecordStatus.falsified
+    await make_record(session, author, title="live")
+    await session.commit()
+    return records
+
+
+def ndjson(resp) -> list[dict]:
+    return [json.loads(line) for line in resp.text.splitlines()]
+
+
+async def test_export_requires_login_or_token(client, session, monkeypatch):
+    await seed_archive(session)
+    assert (await client.get("/api/exports/archive")).status_code == 401
+
+    monkeypatch.setattr(get_settings(), "export_api_tokens", "first, second")
+    bad = await client.get("/api/exports/archive", headers={"Authorization": "Bearer nope"})
+    assert bad.status_code == 401
+    ok = await client.get("/api/exports/archive", headers={"Authorization": "Bearer second"})
+    assert ok.status_code == 200
+    assert len(ndjson(ok)) == 3
+
+
+async def test_ndjson_export_and_resume(client, session):
+    records = await seed_archive(session)
+    await login(client, session)
+    resp = await client.get("/api/exports/archive", params={"format": "ndjson"})
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/x-ndjson"
+    lines = ndjson(resp)
+    assert [line["id"] for line in lines] == [str(r.id) for r in records]
+    assert [len(line["review_requests"]) for line in lines] == [0, 2, 0]
+
+    resumed = await client.get("/api/exports/archive", params={"cursor": lines[0]["cursor"]})
+    assert ndjson(resumed) == lines[1:]
+
+
+async def test_csv_cursor_is_on_each_records_last_row(client, session):
+    await seed_archive(session)
+    await login(client, session)
+    resp = await client.get("/api/exports/archive", params={"format": "csv"})
+    assert resp.headers["content-type"].startswith("text/csv")
+    header, *rows = list(csv.reader(io.StringIO(resp.text)))
+    assert header[0] == "cursor"
+    titles = [row[header.index("title")] for row in rows]
+    assert titles == ["archived 0", "archived 1", "archived 1", "archived 2"]
+    assert [bool(row[0]) for row in rows] == [True, False, True, True]
+
+    resumed = await client.get("/api/exports/archive", params={"format": "csv", "cursor": rows[2][0]})
+    assert list(csv.reader(io.StringIO(resumed.text))) == rows[3:]
+
+
+async def test_gzip_export(client, session):
+    await seed_archive(session)
+    await login(client, session)
+    plain = await client.get("/api/exports/archive", params={"format": "csv"})
+    packed = await client.get("/api/exports/archive", params={"format": "csv", "gzip": "true"})
+    assert packed.headers["content-type"] == "application/gzip"
+    assert packed.headers["content-disposition"] == 'attachment; filename="truburn-archive.csv.gz"'
+    assert gzip.decompress(packed.content) == plain.content
+
+
+async def test_export_filters(client, session):
+    records = await seed_archive(session)
+    await login(client, session)
+    params = {
+        "created_from": records[1].created_at.isoformat(),
+        "created_to": records[2].created_at.isoformat(),
+    }
+    resp = await client.get("/api/exports/archive", params=params)
+    assert [line["title"] for line in ndjson(resp)] == ["archived 1"]
+
+    long_ago = {"occurred_to": "2000-01-01T00:00:00+00:00"}
+    assert (await client.get("/api/exports/archive", params=long_ago)).text == ""
+
+
+async def test_export_rate_limit(client, session, monkeypatch):
+    await login(client, session)
+    monkeypatch.setattr(export_limiter, "limit", 1)
+    assert (await client.get("/api/exports/archive")).status_code == 200
+    limited = await client.get("/api/exports/archive")
+    assert limited.status_code == 429
+    assert int(limited.headers["retry-after"]) > 0
@@ -0,0 +1,58 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select, update
+
+from app.models import FeedBucketCounter, Record, RecordStatus, ReviewRequest
+from app.services.feed_counters import load_bucket_counts, repair_bucket_counters
+from app.services.review import finalize_expired_reviews
+
+from .conftest import login, make_record, make_user
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_counters_follow_the_record_lifecycle(client, session):
+    await login(client, session)
+    resp = await client.post(
+        "/records",
+        data={
+            "title": "Water main break",
+            "body": "Road flooded near the bridge after a pipe burst in the morning.",
+            "time_occurred_start": "2026-10-18T08:00",
+            "time_occurred_end": "2026-10-18T09:00",
+        },
+    )
+    assert resp.status_code == 303
+    assert await load_bucket_counts(session) == {"live": 1, "investigating": 0, "archive": 0}
+
+    record_id = (await session.execute(select(Record.id))).scalar_one()
+    for _ in range(2):
+        resp = await client.post(
+            f"/case/{record_id}/review-requests",
+            data={"reason": "r" * 200, "evidence_url": "https://example.com/evidence"},
+        )
+        assert resp.status_code == 303
+    # The second request leaves the record under review, so it must not move it again.
+    assert await load_bucket_counts(session) == {"live": 0, "investigating": 1, "archive": 0}
+
+    await session.execute(
+        update(ReviewRequest).values(expires_at=datetime.now(timezone.utc) - timedelta(minutes=1))
+    )
+    await session.commit()
+    assert await finalize_expired_reviews(session) == 2
+    assert await load_bucket_counts(session) == {"live": 0, "investigating": 0, "archive": 1}
+
+
+async def test_repair_bucket_counters(session):
+    author = await make_user(session)
+    await make_record(session, author)
+    await make_record(session, author, status=RecordStatus.under_review)
+    await make_record(session, author, status=RecordStatus.verified)
+    await make_record(session, author, status=RecordStatus.falsified)
+    session.add(FeedBucketCounter(bucket="live", record_count=7))
+    await session.commit()
+
+    assert await repair_bucket_counters(session) == {"live": -6, "investigating": 1, "archive": 2}
+    assert await load_bucket_counts(session) == {"live": 1, "investigating": 1, "archive": 2}
+    assert await repair_bucket_counters(session) == {}
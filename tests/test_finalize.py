@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+from sqlalchemy import select
+
+from app.database import AsyncSessionLocal
+from app.models import Record, RecordStatus, ReviewRequest, User
+from app.services.feed_counters import load_bucket_counts
+from app.services.leaderboard import repair_verified_counts
+from app.services.review import finalize_expired_reviews
+
+from .conftest import make_record, make_review_request, make_user
+
+pytestmark = pytest.mark.anyio
+
+
+async def seed(session):
+    author = await make_user(session, "author")
+    requester = await make_user(session, "requester")
+    record = await make_record(session, author)
+    rr = await make_review_request(session, record, requester, expired=True)
+    return author, record, rr
+
+
+@pytest.mark.parametrize("locked", [ReviewRequest, Record])
+async def test_rows_locked_elsewhere_are_skipped(session, locked):
+    _, record, rr = await seed(session)
+    row_id = rr.id if locked is ReviewRequest else record.id
+    async with AsyncSessionLocal() as other:
+        await other.execute(select(locked).where(locked.id == row_id).with_for_update())
+        assert await finalize_expired_reviews(session) == 0
+        await other.rollback()
+    assert await finalize_expired_reviews(session) == 1
+    assert await finalize_expired_reviews(session) == 0
+
+
+async def test_concurrent_finalizers_apply_deltas_once(session):
+    author, _, _ = await seed(session)
+    async with AsyncSessionLocal() as a, AsyncSessionLocal() as b:
+        finalized = await asyncio.gather(finalize_expired_reviews(a), finalize_expired_reviews(b))
+    assert sum(finalized) == 1
+    counts = await load_bucket_counts(session)
+    # Seeded rows bypass the counters, so only the finalizer's deltas show up.
+    assert counts["archive"] == 1
+    assert counts["investigating"] == -1
+    await session.refresh(author)
+    assert author.verified_record_count == 1
+
+
+async def test_repair_verified_counts(session):
+    author, _, _ = await seed(session)
+    other = await make_user(session, "other")
+    await make_record(session, author, status=RecordStatus.verified)
+    await make_record(session, other, status=RecordStatus.falsified)
+    other.verified_record_count = 3
+    await session.commit()
+    await finalize_expired_reviews(session)
+
+    drift = await repair_verified_counts(session, batch_size=1)
+    assert drift == {author.id: 1, other.id: -3}
+    result = await session.execute(select(User.display_name, User.verified_record_count))
+    assert dict(result.all()) == {"author": 2, "requester": 0, "other": 0}
+    assert await repair_verified_counts(session) == {}
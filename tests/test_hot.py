@@ -0,0 +1,57 @@
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import select
+
+from app.models import Record, RecordStatus
+from app.services.hot import HOT_EPOCH, hot_feed_query, hot_score, refresh_stale_hot_scores
+
+from .conftest import make_record, make_review_request, make_user
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.mark.parametrize(
+    "multiplier, reviews, created_at",
+    [
+        (1.0, 0, HOT_EPOCH),
+        (2.5, 0, datetime(2026, 10, 19, 12, 30, tzinfo=timezone.utc)),
+        (1.8, 3, datetime(2025, 2, 28, 23, 59, 59, 999999, tzinfo=timezone.utc)),
+        (1.4, 12, datetime(2023, 6, 1, tzinfo=timezone.utc)),
+    ],
+)
+async def test_sql_score_matches_python(session, multiplier, reviews, created_at):
+    author = await make_user(session)
+    record = await make_record(session, author, resolution_multiplier=multiplier, created_at=created_at)
+    for _ in range(reviews):
+        await make_review_request(session, record, author)
+    assert await refresh_stale_hot_scores(session, batch_size=10) == 1
+    stored = await session.scalar(select(Record.hot_score).where(Record.id == record.id))
+    assert stored == pytest.approx(hot_score(multiplier, reviews, created_at), rel=0, abs=1e-9)
+
+
+async def test_multi_status_feed_merges_by_score(session):
+    author = await make_user(session)
+    for i in range(6):
+        status = RecordStatus.verified if i % 2 else RecordStatus.falsified
+        await make_record(session, author, status=status, title=f"r{i}", hot_score=float(i), hot_score_stale=False)
+    await make_record(session, author, status=RecordStatus.live, title="live", hot_score=99.0, hot_score_stale=False)
+    await make_record(session, author, status=RecordStatus.verified, title="unscored")
+    archive = [RecordStatus.verified, RecordStatus.falsified]
+
+    first = (await session.execute(hot_feed_query(archive, None, 4))).scalars().all()
+    assert [r.title for r in first] == ["r5", "r4", "r3", "r2"]
+    after = (first[-1].hot_score, first[-1].id)
+    rest = (await session.execute(hot_feed_query(archive, after, 4))).scalars().all()
+    assert [r.title for r in rest] == ["r1", "r0"]
+
+
+async def test_hot_feed_pages_the_archive(client, session):
+    author = await make_user(session)
+    for i in range(3):
+        status = RecordStatus.verified if i % 2 else RecordStatus.falsified
+        await make_record(session, author, status=status, title=f"archived {i}", hot_score=float(i), hot_score_stale=False)
+    resp = await client.get("/feed/archive", params={"sort": "hot"})
+    assert resp.status_code == 200
+    positions = [resp.text.index(f"archived {i}") for i in (2, 1, 0)]
+    assert positions == sorted(positions)
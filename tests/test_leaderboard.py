@@ -0,0 +1,86 @@
+import time
+import uuid
+
+import pytest
+from sqlalchemy import update
+
+from app.models import User
+from app.services.leaderboard import Leaderboard, LeaderboardEntry
+
+from .conftest import make_user
+
+
+def loaded(size: int, *scores: int) -> tuple[Leaderboard, list[uuid.UUID]]:
+    """
+    A vp board already holding one entry per score, as if just reloaded.
+    """
+    board = Leaderboard(size=size)
+    ids = [uuid.uuid4() for _ in scores]
+    top = board._boards["vp"]
+    top.entries = sorted(
+        (LeaderboardEntry(user_id, f"user {score}", score) for user_id, score in zip(ids, scores)),
+        key=lambda e: e.sort_key,
+        reverse=True,
+    )
+    top.loaded_at = time.monotonic()
+    return board, ids
+
+
+def scores(board: Leaderboard) -> list[int]:
+    return [e.score for e in board._boards["vp"].entries]
+
+
+def test_observe_before_load_is_ignored():
+    board = Leaderboard(size=3)
+    board.observe("vp", uuid.uuid4(), "new", 5)
+    assert board._boards["vp"].entries == []
+    assert board._boards["vp"].loaded_at is None
+
+
+def test_observe_evicts_the_lowest_entry():
+    board, _ = loaded(3, 9, 5, 3)
+    board.observe("vp", uuid.uuid4(), "new", 7)
+    assert scores(board) == [9, 7, 5]
+
+
+def test_observe_below_a_full_board_is_dropped():
+    board, _ = loaded(3, 9, 5, 3)
+    board.observe("vp", uuid.uuid4(), "new", 2)
+    assert scores(board) == [9, 5, 3]
+    assert board._boards["vp"].loaded_at is not None
+
+
+def test_ranked_user_moves_without_duplicates():
+    board, ids = loaded(3, 9, 5, 3)
+    board.observe("vp", ids[2], "user 3", 10)
+    assert scores(board) == [10, 9, 5]
+    assert len({e.user_id for e in board._boards["vp"].entries}) == 3
+
+
+def test_ranked_user_falling_out_forces_a_reload():
+    board, ids = loaded(3, 9, 5, 3)
+    board.observe("vp", ids[0], "user 9", 1)
+    # Someone outside the cached top K may now belong in it.
+    assert board._boards["vp"].loaded_at is None
+
+
+def test_ties_order_by_id_descending():
+    board, ids = loaded(3, 4, 4)
+    assert [e.user_id for e in board._boards["vp"].entries] == sorted(ids, reverse=True)
+
+
+@pytest.mark.anyio
+async def test_page_recomputes_from_the_index_after_invalidate(session):
+    users = [await make_user(session, f"user {i}", vp_balance=i) for i in range(5)]
+    board = Leaderboard(size=3)
+    entries, more = await board.page(session, "vp", 1)
+    assert [e.display_name for e in entries] == ["user 4", "user 3", "user 2"]
+    assert not more
+
+    await session.execute(update(User).where(User.id == users[0].id).values(vp_balance=100))
+    await session.commit()
+    cached, _ = await board.page(session, "vp", 1)
+    assert cached == entries
+    board.invalidate("vp")
+    entries, _ = await board.page(session, "vp", 1)
+    assert [(e.display_name, e.score) for e in entries] == [("user 0", 100), ("user 4", 4), ("user 3", 3)]
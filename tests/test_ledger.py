@@ -0,0 +1,95 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import update
+
+from app.config import get_settings
+from app.database import AsyncSessionLocal
+from app.models import JobCheckpoint, User, VerificationPoint
+from app.services.ledger import (
+    ROLLUP_CHECKPOINT,
+    reconcile_vp_balances,
+    repair_vp_snapshots,
+    rollup_vp_ledger,
+)
+
+from .conftest import make_user
+
+pytestmark = pytest.mark.anyio
+
+
+def later(seconds: int = 1) -> datetime:
+    return datetime.now(timezone.utc) + timedelta(seconds=seconds)
+
+
+async def mismatches(session) -> list:
+    return [m async for _, batch in reconcile_vp_balances(session) for m in batch]
+
+
+async def spend(session, user, delta: int, commit: bool = True) -> VerificationPoint:
+    user.vp_balance += delta
+    vp = VerificationPoint(user_id=user.id, delta=delta, note="test")
+    session.add(vp)
+    await session.flush()
+    if commit:
+        await session.commit()
+    return vp
+
+
+@pytest.fixture
+def no_settle(monkeypatch):
+    monkeypatch.setattr(get_settings(), "vp_rollup_settle_seconds", 0)
+
+
+async def test_rollup_and_reconcile(session, no_settle):
+    user = await make_user(session, vp_balance=get_settings().initial_vp)
+    for delta in (-1, -1, 3):
+        await spend(session, user, delta)
+    assert await rollup_vp_ledger(session, now=later(), batch_size=2) == 3
+    assert await rollup_vp_ledger(session, now=later()) == 0
+    assert await mismatches(session) == []
+
+
+async def test_settle_window_holds_back_recent_rows(session):
+    user = await make_user(session, vp_balance=get_settings().initial_vp)
+    await spend(session, user, -1)
+    assert await rollup_vp_ledger(session) == 0
+    seconds = get_settings().vp_rollup_settle_seconds
+    assert await rollup_vp_ledger(session, now=later(seconds + 1)) == 1
+
+
+async def test_late_commit_is_detected_and_repaired(session, no_settle):
+    user = await make_user(session, vp_balance=get_settings().initial_vp)
+    async with AsyncSessionLocal() as slow:
+        late = VerificationPoint(user_id=user.id, delta=-2, note="slow writer")
+        slow.add(late)
+        await slow.flush()
+        early_seq = late.seq
+        fast = await spend(session, user, -1)
+        assert fast.seq > early_seq
+        assert await rollup_vp_ledger(session, now=later()) == 1
+        await slow.execute(update(User).where(User.id == user.id).values(vp_balance=User.vp_balance - 2))
+        await slow.commit()
+    session.expunge_all()
+
+    # The high-water mark is already past the late row.
+    assert await rollup_vp_ledger(session, now=later()) == 0
+    [mismatch] = await mismatches(session)
+    assert mismatch.user_id == user.id
+    assert mismatch.expected == mismatch.vp_balance + 2
+
+    assert await repair_vp_snapshots(session, [user.id]) == 1
+    assert await mismatches(session) == []
+
+
+async def test_overlapping_first_runs(session, no_settle):
+    user = await make_user(session, vp_balance=get_settings().initial_vp)
+    await spend(session, user, -1)
+    async with AsyncSessionLocal() as a, AsyncSessionLocal() as b:
+        rolled = await asyncio.gather(
+            rollup_vp_ledger(a, now=later()), rollup_vp_ledger(b, now=later())
+        )
+    assert sorted(rolled) == [0, 1]
+    checkpoint = await session.get(JobCheckpoint, ROLLUP_CHECKPOINT)
+    assert checkpoint.position == 1
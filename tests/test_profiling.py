@@ -0,0 +1,74 @@
+import asyncio
+import logging
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from app.config import get_settings
+from app.profiling import ProfilingMiddleware, span
+
+pytestmark = pytest.mark.anyio
+
+
+async def timed(request):
+    with span("render"):
+        return PlainTextResponse("ok")
+
+
+async def slow(request):
+    await asyncio.sleep(0.02)
+    return PlainTextResponse("ok")
+
+
+@pytest.fixture
+def profiled(monkeypatch):
+    """
+    Build the middleware with the given env; it reads settings once at construction.
+    """
+
+    def build(**env: str) -> httpx.AsyncClient:
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        get_settings.cache_clear()
+        app = ProfilingMiddleware(Starlette(routes=[Route("/timed", timed), Route("/slow", slow)]))
+        get_settings.cache_clear()
+        return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+    yield build
+    get_settings.cache_clear()
+
+
+async def test_server_timing_is_off_by_default(profiled, monkeypatch):
+    monkeypatch.delenv("SERVER_TIMING_ENABLED", raising=False)
+    async with profiled() as client:
+        resp = await client.get("/timed")
+    assert resp.status_code == 200
+    assert "server-timing" not in resp.headers
+
+
+async def test_server_timing_header(profiled):
+    async with profiled(SERVER_TIMING_ENABLED="true") as client:
+        resp = await client.get("/timed")
+    names = [part.split(";")[0] for part in resp.headers["server-timing"].split(", ")]
+    assert names == ["render", "db", "total"]
+    assert 'desc="0 queries"' in resp.headers["server-timing"]
+
+
+async def test_slow_request_log(profiled, caplog):
+    caplog.set_level(logging.WARNING, logger="truburn.profiling")
+    async with profiled(SLOW_REQUEST_MS="10", SLOW_REQUEST_SAMPLE_RATE="1.0") as client:
+        await client.get("/timed")
+        assert caplog.records == []
+        await client.get("/slow")
+    assert len(caplog.records) == 1
+    assert caplog.records[0].getMessage().startswith("slow request GET /slow: ")
+
+
+async def test_slow_request_log_disabled(profiled, caplog):
+    caplog.set_level(logging.WARNING, logger="truburn.profiling")
+    async with profiled(SLOW_REQUEST_MS="0", SLOW_REQUEST_SAMPLE_RATE="1.0") as client:
+        await client.get("/slow")
+    assert caplog.records == []
@@ -0,0 +1,99 @@
+import pytest
+from sqlalchemy import select
+
+from app.models import Record, RecordStatus, ReviewRequest
+from app.profiling import QueryBudgetExceeded
+from app.routes import pages, records
+
+from .conftest import login, make_record, make_review_request, make_user
+
+pytestmark = pytest.mark.anyio
+
+
+async def seed_expired_review(session, counter: bool = False) -> Record:
+    author = await make_user(session, "author")
+    requester = await make_user(session, "requester")
+    record = await make_record(session, author)
+    await make_review_request(session, record, requester, expired=True, counter=counter)
+    return record
+
+
+@pytest.mark.parametrize("sort", ["new", "hot"])
+async def test_feed_anonymous(client, session, within_budget, sort):
+    await make_record(session, await make_user(session))
+    with within_budget(records.feed):
+        resp = await client.get(f"/feed/live?sort={sort}")
+    assert resp.status_code == 200
+
+
+@pytest.mark.parametrize("counter", [False, True])
+async def test_feed_finalizing_as_logged_in_user(client, session, within_budget, counter):
+    record = await seed_expired_review(session, counter=counter)
+    await login(client, session)
+    with within_budget(records.feed):
+        resp = await client.get("/feed/archive")
+    assert resp.status_code == 200
+    await session.refresh(record)
+    assert record.status == (RecordStatus.falsified if counter else RecordStatus.verified)
+
+
+async def test_record_detail_finalizing_as_logged_in_user(client, session, within_budget):
+    record = await seed_expired_review(session)
+    await login(client, session)
+    with within_budget(records.record_detail):
+        resp = await client.get(f"/case/{record.id}")
+    assert resp.status_code == 200
+    await session.refresh(record)
+    assert record.status == RecordStatus.verified
+
+
+async def test_record_detail_open_review(client, session, within_budget):
+    author = await make_user(session, "author")
+    record = await make_record(session, author)
+    await make_review_request(session, record, author)
+    with within_budget(records.record_detail):
+        resp = await client.get(f"/case/{record.id}")
+    assert resp.status_code == 200
+
+
+async def test_vault(client, session, within_budget):
+    user = await login(client, session)
+    record = await make_record(session, user)
+    await make_review_request(session, record, user)
+    with within_budget(pages.vault):
+        resp = await client.get("/vault")
+    assert resp.status_code == 200
+
+
+async def test_create_record(client, session, within_budget):
+    await login(client, session)
+    with within_budget(records.create_record):
+        resp = await client.post(
+            "/records",
+            data={
+                "title": "Water main break",
+                "body": "Road flooded near the bridge after a pipe burst in the morning.",
+                "time_occurred_start": "2026-10-18T08:00",
+                "time_occurred_end": "2026-10-18T09:00",
+            },
+        )
+    assert resp.status_code == 303
+
+
+async def test_create_review_request(client, session, within_budget):
+    user = await login(client, session)
+    record = await make_record(session, await make_user(session, "author"))
+    with within_budget(records.create_review_request):
+        resp = await client.post(
+            f"/case/{record.id}/review-requests",
+            data={"reason": "x" * 200, "evidence_url": "https://example.com/counter"},
+        )
+    assert resp.status_code == 303
+    result = await session.execute(select(ReviewRequest).where(ReviewRequest.requester_id == user.id))
+    assert result.scalar_one().record_id == record.id
+
+
+async def test_raise_mode_fails_the_request(client, session, monkeypatch):
+    monkeypatch.setattr(records.feed, "__query_budget__", 1)
+    with pytest.raises(QueryBudgetExceeded):
+        await client.get("/feed/live")
@@ -0,0 +1,108 @@
+import pytest
+from sqlalchemy import select
+
+from app.models import ReviewRequest
+from app.pagination import REVIEWS_PAGE_SIZE, encode_cursor
+from app.routes import records
+from app.services.evidence import register_evidence_urls
+from app.services.review import finalize_expired_reviews
+from app.services.snapshots import render_case_snapshot, snapshot_path, wait_for_pending_snapshots
+
+from .conftest import login, make_record, make_review_request, make_user
+
+pytestmark = pytest.mark.anyio
+
+
+async def finalized_case(client, session):
+    author = await make_user(session, "author")
+    record = await make_record(session, author, evidence_url="https://example.com/primary")
+    rr = await make_review_request(session, record, author, expired=True)
+    await register_evidence_urls(session, [record.evidence_url, rr.evidence_url])
+    await session.commit()
+    assert (await client.get("/feed/archive")).status_code == 200
+    await wait_for_pending_snapshots()
+    assert snapshot_path(record.id).is_file()
+    return record, rr
+
+
+async def test_anonymous_visitors_get_the_snapshot(client, session, within_budget):
+    record, rr = await finalized_case(client, session)
+    with within_budget(records.record_detail) as captured:
+        resp = await client.get(f"/case/{record.id}")
+    assert resp.status_code == 200
+    assert captured == []
+    assert resp.headers["cache-control"] == "public, max-age=300"
+    assert resp.headers["vary"] == "Cookie"
+    assert "immutable" not in resp.headers["cache-control"]
+    assert f'hx-get="/case/{record.id}/panels"' in resp.text
+    assert "リンク未確認" not in resp.text
+
+    cached = await client.get(f"/case/{record.id}", headers={"If-None-Match": resp.headers["etag"]})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == resp.headers["etag"]
+
+
+async def test_logged_in_users_get_their_own_header(client, session):
+    record, _ = await finalized_case(client, session)
+    await login(client, session, "alice")
+    resp = await client.get(f"/case/{record.id}")
+    assert resp.status_code == 200
+    assert "alice" in resp.text
+    assert "Logout" in resp.text
+    assert "Mock Wallet Login" not in resp.text
+    assert "immutable" not in resp.headers.get("cache-control", "")
+
+
+async def test_panels_carry_current_link_checks(client, session, within_budget):
+    record, rr = await finalized_case(client, session)
+    with within_budget(records.record_panels):
+        resp = await client.get(f"/case/{record.id}/panels")
+    assert resp.status_code == 200
+    assert 'id="link-check-record" hx-swap-oob="true"' in resp.text
+    assert f'id="link-check-{rr.id}" hx-swap-oob="true"' in resp.text
+
+
+async def test_panels_page_review_badges(client, session, within_budget):
+    record, _ = await finalized_case(client, session)
+    author = await make_user(session, "late")
+    for _ in range(REVIEWS_PAGE_SIZE):
+        await make_review_request(session, record, author)
+    result = await session.execute(
+        select(ReviewRequest)
+        .where(ReviewRequest.record_id == record.id)
+        .order_by(ReviewRequest.created_at.desc(), ReviewRequest.id.desc())
+    )
+    newest_first = result.scalars().all()
+    with within_budget(records.record_panels):
+        first = await client.get(f"/case/{record.id}/panels")
+    assert first.text.count('hx-swap-oob="true"') == REVIEWS_PAGE_SIZE + 1
+    assert f"link-check-{newest_first[-1].id}" not in first.text
+
+    last_shown = newest_first[REVIEWS_PAGE_SIZE - 1]
+    cursor = encode_cursor(last_shown.created_at, last_shown.id)
+    older = await client.get(f"/case/{record.id}/panels", params={"reviews_before": cursor})
+    assert f'id="link-check-{newest_first[-1].id}" hx-swap-oob="true"' in older.text
+    assert older.text.count('hx-swap-oob="true"') == 2
+
+
+async def test_snapshot_renders_one_page_of_reviews(session):
+    author = await make_user(session)
+    record = await make_record(session, author)
+    for _ in range(REVIEWS_PAGE_SIZE + 1):
+        await make_review_request(session, record, author, expired=True)
+    pending = await make_review_request(session, record, author)
+    assert await render_case_snapshot(session, record.id) is None
+
+    await session.delete(pending)
+    await session.commit()
+    await finalize_expired_reviews(session)
+    html = await render_case_snapshot(session, record.id)
+    result = await session.execute(
+        select(ReviewRequest.id)
+        .where(ReviewRequest.record_id == record.id)
+        .order_by(ReviewRequest.created_at.desc(), ReviewRequest.id.desc())
+    )
+    newest_first = result.scalars().all()
+    assert all(f"link-check-{rr_id}" in html for rr_id in newest_first[:REVIEWS_PAGE_SIZE])
+    assert f"link-check-{newest_first[-1]}" not in html
+    assert f"/case/{record.id}?reviews_before=" in html